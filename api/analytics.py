@@ -0,0 +1,123 @@
+import re
+from datetime import date
+
+from .feedback import split_sections
+from .storage import connect
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS turn_stats (
+    session_id TEXT NOT NULL,
+    run_id TEXT NOT NULL,
+    turn INTEGER NOT NULL,
+    day TEXT NOT NULL,
+    topic TEXT NOT NULL,
+    cohort TEXT NOT NULL,
+    answer_chars INTEGER NOT NULL,
+    latency_ms INTEGER NOT NULL,
+    improvement_points INTEGER NOT NULL,
+    prompt_tokens INTEGER NOT NULL,
+    completion_tokens INTEGER NOT NULL,
+    PRIMARY KEY (session_id, run_id, turn)
+);
+CREATE TABLE IF NOT EXISTS topic_rollup (
+    day TEXT NOT NULL,
+    topic TEXT NOT NULL,
+    cohort TEXT NOT NULL,
+    turns INTEGER NOT NULL,
+    answer_chars INTEGER NOT NULL,
+    latency_ms INTEGER NOT NULL,
+    improvement_points INTEGER NOT NULL,
+    tokens INTEGER NOT NULL,
+    PRIMARY KEY (day, topic, cohort)
+);
+"""
+
+# Columns the rollups can be grouped and filtered by
+GROUP_COLUMNS = ("topic", "day", "cohort")
+
+_ready = False
+
+def get_db():
+    global _ready
+    conn, lock = connect("analytics")
+    if not _ready:
+        with lock:
+            conn.executescript(SCHEMA)
+        _ready = True
+    return conn, lock
+
+def count_improvement_points(reply):
+    """Bullet points in the "Areas for Improvement" section (1 if it is prose without bullets)"""
+    for section, text in split_sections(reply):
+        if section == "areas_improvement":
+            bullets = sum(1 for line in text.splitlines() if re.match(r"\s*(?:[-*•]|\d+\.)\s+", line))
+            return bullets or 1
+    return 0
+
+def record_turn(session_id, turn, topic, cohort, answer, reply, latency, usage, run_id=""):
+    """Store per-turn stats and fold them into the day/topic/cohort rollup.
+
+    Session ids can be reused after a restart (the API falls back to "default"),
+    so run_id should identify this lifetime of the session. A turn is only
+    counted once: recording the same (session, run, turn) again is ignored.
+    """
+    prompt_tokens, completion_tokens = usage or (0, 0)
+    day = date.today().isoformat()
+    stats = (
+        len(answer),
+        round(latency * 1000),
+        count_improvement_points(reply),
+    )
+    conn, lock = get_db()
+    with lock:
+        inserted = conn.execute(
+            "INSERT OR IGNORE INTO turn_stats VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (session_id, run_id, turn, day, topic, cohort, *stats, prompt_tokens, completion_tokens)
+        ).rowcount
+        if inserted:
+            conn.execute(
+                "INSERT INTO topic_rollup VALUES (?, ?, ?, 1, ?, ?, ?, ?) "
+                "ON CONFLICT (day, topic, cohort) DO UPDATE SET "
+                "turns = turns + 1, "
+                "answer_chars = answer_chars + excluded.answer_chars, "
+                "latency_ms = latency_ms + excluded.latency_ms, "
+                "improvement_points = improvement_points + excluded.improvement_points, "
+                "tokens = tokens + excluded.tokens",
+                (day, topic, cohort, *stats, prompt_tokens + completion_tokens)
+            )
+        conn.commit()
+
+def query_rollups(group_by=("topic",), since=None, until=None, topic=None, cohort=None):
+    """Aggregate the rollup table; group_by is a sequence of GROUP_COLUMNS, dates are ISO strings"""
+    if not group_by or any(column not in GROUP_COLUMNS for column in group_by):
+        raise ValueError(f"group_by must be made of: {', '.join(GROUP_COLUMNS)}")
+    columns = ", ".join(group_by)
+    sql = (
+        f"SELECT {columns}, SUM(turns), SUM(answer_chars), SUM(latency_ms), "
+        f"SUM(improvement_points), SUM(tokens) FROM topic_rollup WHERE 1 = 1"
+    )
+    params = []
+    for clause, value in (("day >= ?", since), ("day <= ?", until), ("topic = ?", topic), ("cohort = ?", cohort)):
+        if value:
+            sql += f" AND {clause}"
+            params.append(value)
+    sql += f" GROUP BY {columns} ORDER BY {columns}"
+
+    conn, lock = get_db()
+    with lock:
+        rows = conn.execute(sql, params).fetchall()
+
+    results = []
+    for row in rows:
+        keys = dict(zip(group_by, row[:len(group_by)]))
+        turns, answer_chars, latency_ms, improvement_points, tokens = row[len(group_by):]
+        results.append(dict(
+            keys,
+            turns=turns,
+            avg_answer_chars=round(answer_chars / turns, 1),
+            avg_latency_ms=round(latency_ms / turns),
+            avg_improvement_points=round(improvement_points / turns, 2),
+            avg_tokens=round(tokens / turns),
+            total_tokens=tokens,
+        ))
+    return results
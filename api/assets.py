@@ -0,0 +1,89 @@
+import gzip
+import hashlib
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip is always available
+    brotli = None
+
+# Hashed assets never change under the same URL; the shell must be revalidated
+# so it always points at the current asset hashes.
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+SHELL_CACHE_CONTROL = "public, max-age=0, must-revalidate"
+
+class Asset:
+    """A static response body with precomputed compressed variants and a content-hash ETag"""
+
+    def __init__(self, body, content_type, cache_control):
+        self.content_type = content_type
+        self.cache_control = cache_control
+        self.digest = hashlib.sha256(body).hexdigest()[:16]
+        self.variants = {"identity": body, "gzip": gzip.compress(body, compresslevel=9, mtime=0)}
+        if brotli is not None:
+            self.variants["br"] = brotli.compress(body, quality=11)
+
+    def etag(self, encoding):
+        return f'"{self.digest}"' if encoding == "identity" else f'"{self.digest}-{encoding}"'
+
+    def matches(self, if_none_match):
+        """True if an If-None-Match header refers to any variant of this asset"""
+        if not if_none_match:
+            return False
+        tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return "*" in tags or any(tag.strip('"').split("-")[0] == self.digest for tag in tags)
+
+def choose_encoding(accept_encoding, available):
+    """Pick the best encoding the client accepts: br, then gzip, then identity"""
+    accepted = {}
+    for part in (accept_encoding or "").split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        if params.strip().startswith("q="):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip().lower()] = quality
+    for encoding in ("br", "gzip"):
+        if encoding in available and accepted.get(encoding, accepted.get("*", 0)) > 0:
+            return encoding
+    return "identity"
+
+_assets = None
+
+def get_assets():
+    """Build the shell and its hashed assets once per process; returns {path: Asset}"""
+    global _assets
+    if _assets is None:
+        from .template import HTML_TEMPLATE, SCRIPT, STYLES
+        styles = Asset(STYLES.encode("utf-8"), "text/css; charset=utf-8", IMMUTABLE_CACHE_CONTROL)
+        script = Asset(SCRIPT.encode("utf-8"), "application/javascript; charset=utf-8", IMMUTABLE_CACHE_CONTROL)
+        styles_path = f"/assets/app.{styles.digest}.css"
+        script_path = f"/assets/app.{script.digest}.js"
+        shell = HTML_TEMPLATE.replace("__STYLES_HREF__", styles_path).replace("__SCRIPT_SRC__", script_path)
+        _assets = {
+            "/": Asset(shell.encode("utf-8"), "text/html; charset=utf-8", SHELL_CACHE_CONTROL),
+            styles_path: styles,
+            script_path: script,
+        }
+    return _assets
+
+def asset_response_parts(path, if_none_match, accept_encoding):
+    """Return (status, body, headers) for a static path, or None if it is unknown"""
+    asset = get_assets().get(path)
+    if asset is None:
+        return None
+    encoding = choose_encoding(accept_encoding, asset.variants)
+    headers = {
+        "ETag": asset.etag(encoding),
+        "Cache-Control": asset.cache_control,
+        "Vary": "Accept-Encoding",
+    }
+    if asset.matches(if_none_match):
+        return 304, b"", headers
+    body = asset.variants[encoding]
+    headers["Content-Type"] = asset.content_type
+    headers["Content-Length"] = str(len(body))
+    if encoding != "identity":
+        headers["Content-Encoding"] = encoding
+    return 200, body, headers
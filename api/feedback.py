@@ -0,0 +1,416 @@
+import logging
+import re
+
+# System prompt used for every evaluation turn (four fixed section headers)
+INTERVIEWER_PROMPT = (
+    "You are a technical interviewer preparing B.Tech CSE students for internships.\n\n"
+    "CRITICAL: You MUST respond using EXACTLY this structure. Copy this format exactly:\n\n"
+    "### ✅ What's Good\n"
+    "[2-3 bullet points about what the student did well]\n\n"
+    "### ⚠️ Areas for Improvement\n"
+    "[2-3 bullet points about what could be improved]\n\n"
+    "### 📝 Model Answer\n"
+    "[A complete, detailed, professional answer that a candidate would give in an interview. "
+    "This must be comprehensive with multiple paragraphs, examples, and detailed explanations. "
+    "This section should be SIGNIFICANTLY longer than the evaluation sections - at least 3-5 paragraphs.]\n\n"
+    "### ❓ Follow-up Question\n"
+    "[Ask the next interview question]\n\n"
+    "IMPORTANT RULES:\n"
+    "1. ALWAYS start with '### ✅ What's Good' (exactly this text)\n"
+    "2. ALWAYS include '### ⚠️ Areas for Improvement' (exactly this text)\n"
+    "3. ALWAYS include '### 📝 Model Answer' (exactly this text)\n"
+    "4. ALWAYS end with '### ❓ Follow-up Question' (exactly this text)\n"
+    "5. Use these exact headers with the emojis and markdown formatting\n"
+    "6. Do NOT write in paragraphs without headers\n"
+    "7. Do NOT use numbered lists like '1. What's good'\n"
+    "8. Do NOT combine sections\n"
+    "9. The Model Answer must be a complete answer, not a summary\n"
+)
+
+# Shorter wording of the same four-section contract, sent without the reminder
+COMPACT_INTERVIEWER_PROMPT = (
+    "You are a technical interviewer preparing B.Tech CSE students for internships. "
+    "Reply with exactly these four markdown headers, in this order, and nothing outside them:\n"
+    "### ✅ What's Good\n(2-3 bullets)\n"
+    "### ⚠️ Areas for Improvement\n(2-3 bullets)\n"
+    "### 📝 Model Answer\n(complete interview-quality answer, several paragraphs with examples; the longest section)\n"
+    "### ❓ Follow-up Question\n(the next interview question)\n"
+    "No numbered section titles, no merged sections.\n"
+)
+
+# Original wording used by the Flask API (bold headers instead of ### headers)
+API_INTERVIEWER_PROMPT = (
+    "You are a technical interviewer preparing B.Tech CSE students for internships. "
+    "When evaluating answers, structure your response EXACTLY as follows:\n\n"
+    "✅ **What's Good:**\n"
+    "- [List positive aspects with bullet points]\n\n"
+    "⚠️ **Areas for Improvement:**\n"
+    "- [List specific improvements needed]\n\n"
+    "💡 **Model Answer:**\n"
+    "[Provide a comprehensive, well-structured answer in a different tone - more formal and complete]\n\n"
+    "❓ **Follow-up Question:**\n"
+    "[Ask a relevant follow-up question]\n\n"
+    "Keep responses clear, concise, and professional. Use proper formatting with line breaks."
+)
+
+# Appended once the interview is past the opening greeting
+FORMAT_REMINDER = (
+    "\n\n⚠️⚠️⚠️ CRITICAL FORMAT REMINDER ⚠️⚠️⚠️\n"
+    "You MUST respond using EXACTLY these headers (copy them exactly):\n"
+    "### ✅ What's Good\n"
+    "### ⚠️ Areas for Improvement\n"
+    "### 📝 Model Answer\n"
+    "### ❓ Follow-up Question\n\n"
+    "Do NOT use:\n"
+    "- Numbered lists like '1. What's good:'\n"
+    "- Paragraphs without headers\n"
+    "- Combined sections\n"
+    "- Any other format\n\n"
+    "You MUST use the exact headers shown above with the emojis and markdown formatting.\n"
+)
+
+# Instructions for rewriting a reply that came back without the four headers
+FORMAT_REPAIR_PROMPT = (
+    "Rewrite the interviewer feedback you are given into exactly these four sections, "
+    "keeping its content and wording. Output only the rewritten feedback.\n\n"
+    "### ✅ What's Good\n"
+    "### ⚠️ Areas for Improvement\n"
+    "### 📝 Model Answer\n"
+    "### ❓ Follow-up Question\n"
+)
+
+# Canonical section headers, in the order they must appear
+SECTION_HEADERS = (
+    "### ✅ What's Good",
+    "### ⚠️ Areas for Improvement",
+    "### 📝 Model Answer",
+    "### ❓ Follow-up Question",
+)
+
+# Emoji that opens each section, in both the ### and **bold** header styles
+SECTION_MARKERS = {
+    "✅": "whats_good",
+    "⚠️": "areas_improvement",
+    "📝": "model_answer",
+    "💡": "model_answer",
+    "❓": "followup",
+}
+SECTION_HEADER_RE = re.compile(r"^(?:#{1,6}\s*)?(?:\*\*)?\s*(✅|⚠️|📝|💡|❓)")
+
+def split_sections(content):
+    """Split a reply into (section, text) pairs; text before the first header is "other" """
+    sections = []
+    current, lines = "other", []
+    for line in content.splitlines():
+        match = SECTION_HEADER_RE.match(line.strip())
+        if match:
+            if "\n".join(lines).strip():
+                sections.append((current, "\n".join(lines).strip()))
+            current, lines = SECTION_MARKERS[match.group(1)], []
+        else:
+            lines.append(line)
+    if "\n".join(lines).strip():
+        sections.append((current, "\n".join(lines).strip()))
+    return sections
+
+def has_required_sections(content):
+    """True if content contains all four canonical section headers"""
+    return all(header in content for header in SECTION_HEADERS)
+
+def build_context(resume_text="", topic="General"):
+    """Resume and topic context appended to the system prompt"""
+    context = ""
+    if resume_text:
+        context += f"\nHere is the candidate's resume:\n{resume_text}\n"
+    if topic != "General":
+        context += f"\nFocus questions on: {topic}\n"
+    return context
+
+# Prompt variants compared by benchmarks/prompt_size.py; pick one with INTERVIEWER_PROMPT_VARIANT
+PROMPT_VARIANTS = {
+    "full": INTERVIEWER_PROMPT,
+    "compact": COMPACT_INTERVIEWER_PROMPT,
+    "api": API_INTERVIEWER_PROMPT,
+}
+
+def resolve_prompt_variant(name, default):
+    """name if it is a known variant, else default with a warning (e.g. a typo in INTERVIEWER_PROMPT_VARIANT)"""
+    if name in PROMPT_VARIANTS:
+        return name
+    logging.getLogger(__name__).warning(
+        "Unknown prompt variant %r (expected one of: %s); using %r", name, ", ".join(PROMPT_VARIANTS), default
+    )
+    return default
+
+def build_system_prompt(context="", format_reminder=False, variant="full"):
+    """Full system prompt for an evaluation turn (only the "full" variant uses the reminder)"""
+    if variant != "full":
+        return PROMPT_VARIANTS[variant] + context
+    return INTERVIEWER_PROMPT + (FORMAT_REMINDER if format_reminder else "") + context
+
+def parse_and_enforce_format(content):
+    """Parse the response and enforce the required format structure."""
+    # Check if this is an initial greeting (no evaluation needed)
+    if "Tell me about yourself" in content or ("Let's start" in content and len(content) < 50):
+        return content
+    
+    # Check if format is already correct
+    has_correct_format = (
+        "### ✅ What's Good" in content or "### ✅ What's good" in content
+    ) and (
+        "### ⚠️ Areas for Improvement" in content or "### ⚠️ Areas for improvement" in content
+    ) and (
+        "### 📝 Model Answer" in content or "### 📝 Model answer" in content
+    ) and (
+        "### ❓ Follow-up Question" in content or "### ❓ Follow-up question" in content or "### ❓ Followup Question" in content
+    )
+    
+    if has_correct_format:
+        # Format is already correct, just normalize headers
+        content = content.replace("### ✅ What's good", "### ✅ What's Good")
+        content = content.replace("### ⚠️ Areas for improvement", "### ⚠️ Areas for Improvement")
+        content = content.replace("### 📝 Model answer", "### 📝 Model Answer")
+        content = content.replace("### ❓ Follow-up question", "### ❓ Follow-up Question")
+        content = content.replace("### ❓ Followup Question", "### ❓ Follow-up Question")
+        return content
+    
+    # Try to extract sections using regex-like splitting
+    sections = {}
+    
+    # Patterns to find sections - including conversational formats
+    patterns = {
+        "whats_good": [
+            r"###\s*✅\s*What'?s?\s+Good",
+            r"✅\s*What'?s?\s+Good",
+            r"\*\*What'?s?\s+Good\*\*",
+            r"What'?s?\s+Good:",
+            r"\d+\.\s*What'?s?\s+good:?",
+            r"What'?s?\s+good:?",
+            r"1\.\s*What'?s?\s+good",
+        ],
+        "areas_improvement": [
+            r"###\s*⚠️\s*Areas\s+for\s+Improvement",
+            r"⚠️\s*Areas\s+for\s+Improvement",
+            r"\*\*Areas\s+for\s+Improvement\*\*",
+            r"Areas\s+for\s+Improvement:",
+            r"\d+\.\s*What\s+can\s+be\s+improved:?",
+            r"What\s+can\s+be\s+improved:?",
+            r"2\.\s*What\s+can\s+be\s+improved",
+            r"Areas?\s+for\s+improvement:?",
+            r"Improvement:?",
+        ],
+        "model_answer": [
+            r"###\s*📝\s*Model\s+Answer",
+            r"📝\s*Model\s+Answer",
+            r"\*\*Model\s+Answer\*\*",
+            r"Model\s+Answer:",
+            r"\d+\.\s*(A\s+)?model\s+answer:?",
+            r"(A\s+)?model\s+answer:?",
+            r"3\.\s*(A\s+)?model\s+answer",
+            r"A\s+good\s+(answer|introduction|response)",
+        ],
+        "followup": [
+            r"###\s*❓\s*Follow-?up\s+Question",
+            r"❓\s*Follow-?up\s+Question",
+            r"\*\*Follow-?up\s+Question\*\*",
+            r"Follow-?up\s+Question:",
+            r"Now,?\s+let'?s",
+            r"Can\s+you\s+explain",
+            r"Now\s+let'?s\s+dive",
+            r"Let'?s\s+dive",
+        ]
+    }
+    
+    # Find all section markers in content
+    section_positions = []
+    for section_name, pattern_list in patterns.items():
+        for pattern in pattern_list:
+            matches = list(re.finditer(pattern, content, re.IGNORECASE | re.MULTILINE))
+            for match in matches:
+                section_positions.append((match.start(), section_name, match.group()))
+    
+    # Sort by position
+    section_positions.sort(key=lambda x: x[0])
+    
+    # Extract content between sections
+    if section_positions:
+        for i, (pos, section_name, marker) in enumerate(section_positions):
+            # Find end position (start of next section or end of content)
+            if i + 1 < len(section_positions):
+                end_pos = section_positions[i + 1][0]
+            else:
+                end_pos = len(content)
+            
+            # Extract section content (skip the marker line)
+            section_content = content[pos:end_pos]
+            # Remove the marker line
+            lines = section_content.split('\n')
+            if len(lines) > 1:
+                section_text = '\n'.join(lines[1:]).strip()
+            else:
+                section_text = ""
+            
+            if section_text:
+                sections[section_name] = section_text
+    
+    # If we found sections, reconstruct in proper format
+    if sections:
+        formatted_parts = []
+        if "whats_good" in sections:
+            formatted_parts.append("### ✅ What's Good\n" + sections["whats_good"])
+        if "areas_improvement" in sections:
+            formatted_parts.append("### ⚠️ Areas for Improvement\n" + sections["areas_improvement"])
+        if "model_answer" in sections:
+            formatted_parts.append("### 📝 Model Answer\n" + sections["model_answer"])
+        if "followup" in sections:
+            formatted_parts.append("### ❓ Follow-up Question\n" + sections["followup"])
+        
+        if formatted_parts:
+            return "\n\n".join(formatted_parts) + "\n"
+    
+    # Try to extract from conversational/numbered format (like "1. What's good:", "2. What can be improved:", etc.)
+    content_lower = content.lower()
+    
+    # Check for numbered list format
+    if re.search(r'\d+\.\s*(what\'?s?\s+good|what\'?s?\s+can\s+be\s+improved|model\s+answer)', content_lower):
+        # Split by numbered items
+        lines = content.split('\n')
+        current_section = None
+        section_content = {"whats_good": [], "areas_improvement": [], "model_answer": [], "followup": []}
+        
+        i = 0
+        while i < len(lines):
+            line = lines[i]
+            line_lower = line.lower().strip()
+            
+            # Check if line starts a new section
+            if re.match(r'^\d+\.\s*(what\'?s?\s+good|what\s+is\s+good)', line_lower):
+                current_section = "whats_good"
+                # Extract content after the marker (could be on same line or next lines)
+                match = re.search(r':\s*(.+)', line, re.IGNORECASE)
+                if match:
+                    content_after_colon = match.group(1).strip()
+                    if content_after_colon:
+                        section_content["whats_good"].append(content_after_colon)
+            elif re.match(r'^\d+\.\s*(what\s+can\s+be\s+improved|areas?\s+for\s+improvement|improvement)', line_lower):
+                current_section = "areas_improvement"
+                match = re.search(r':\s*(.+)', line, re.IGNORECASE)
+                if match:
+                    content_after_colon = match.group(1).strip()
+                    if content_after_colon:
+                        section_content["areas_improvement"].append(content_after_colon)
+            elif re.match(r'^\d+\.\s*(a\s+)?model\s+answer', line_lower):
+                current_section = "model_answer"
+                match = re.search(r':\s*(.+)', line, re.IGNORECASE)
+                if match:
+                    content_after_colon = match.group(1).strip()
+                    if content_after_colon:
+                        section_content["model_answer"].append(content_after_colon)
+            elif current_section and line.strip():
+                # Continue adding to current section until we hit another numbered item or question
+                if re.match(r'^\d+\.', line.strip()):
+                    # Hit another numbered item, stop current section
+                    current_section = None
+                    continue
+                section_content[current_section].append(line.strip())
+            i += 1
+        
+        # Extract follow-up question (usually starts with "Now" or "Can you" or contains a question mark)
+        question_lines = []
+        question_start_idx = None
+        
+        # Look for question starting phrases
+        for line_idx, line in enumerate(lines):
+            line_stripped = line.strip()
+            if re.match(r'^(Now,?\s+let\'?s|Can\s+you\s+explain|Let\'?s\s+dive)', line_stripped, re.IGNORECASE):
+                question_start_idx = line_idx
+                break
+        
+        # If no clear question start found, look for sentences with question marks near the end
+        if question_start_idx is None:
+            for line_idx in range(len(lines) - 1, max(0, len(lines) - 5), -1):
+                if '?' in lines[line_idx]:
+                    question_start_idx = line_idx
+                    break
+        
+        # Extract question content
+        if question_start_idx is not None:
+            for line_idx in range(question_start_idx, len(lines)):
+                line = lines[line_idx].strip()
+                if line:
+                    question_lines.append(line)
+        
+        # Reconstruct in proper format
+        formatted_parts = []
+        
+        if section_content["whats_good"]:
+            whats_good_text = '\n'.join(section_content["whats_good"]).strip()
+            # Convert to bullet points if it's not already
+            if not whats_good_text.startswith('-'):
+                whats_good_text = '- ' + whats_good_text.replace('\n', '\n- ')
+            formatted_parts.append("### ✅ What's Good\n" + whats_good_text)
+        
+        if section_content["areas_improvement"]:
+            areas_text = '\n'.join(section_content["areas_improvement"]).strip()
+            if not areas_text.startswith('-'):
+                areas_text = '- ' + areas_text.replace('\n', '\n- ')
+            formatted_parts.append("### ⚠️ Areas for Improvement\n" + areas_text)
+        
+        if section_content["model_answer"]:
+            model_text = '\n'.join(section_content["model_answer"]).strip()
+            formatted_parts.append("### 📝 Model Answer\n" + model_text)
+        elif len(content) > 300:
+            # If we have long content but no model answer extracted, use middle section
+            paragraphs = [p.strip() for p in content.split('\n\n') if p.strip() and len(p.strip()) > 50]
+            if paragraphs:
+                # Use the longest paragraph as model answer
+                model_text = max(paragraphs, key=len)
+                formatted_parts.append("### 📝 Model Answer\n" + model_text)
+        
+        if question_lines:
+            formatted_parts.append("### ❓ Follow-up Question\n" + ' '.join(question_lines))
+        elif len(formatted_parts) < 4:
+            # Try to find question at the end
+            last_paragraphs = [p.strip() for p in content.split('\n\n') if p.strip()]
+            if last_paragraphs and re.search(r'\?', last_paragraphs[-1]):
+                formatted_parts.append("### ❓ Follow-up Question\n" + last_paragraphs[-1])
+        
+        if len(formatted_parts) >= 3:  # At least 3 sections found
+            return "\n\n".join(formatted_parts) + "\n"
+    
+    # If we still couldn't parse, try splitting by sentences/paragraphs
+    if len(content) > 200:
+        # Look for question marks to identify the follow-up question
+        sentences = re.split(r'([.!?]+)', content)
+        question_text = ""
+        non_question_text = []
+        
+        for i in range(len(sentences)):
+            if sentences[i].strip() and '?' in sentences[i]:
+                # Found a question
+                question_idx = i
+                question_text = ''.join(sentences[question_idx:question_idx+2] if question_idx+1 < len(sentences) else [sentences[question_idx]])
+                non_question_text = ''.join(sentences[:question_idx])
+                break
+        
+        if question_text and len(non_question_text) > 100:
+            # Split non-question text into evaluation and model answer
+            paragraphs = [p.strip() for p in non_question_text.split('\n\n') if p.strip()]
+            if len(paragraphs) >= 2:
+                # First paragraph(s) = evaluation, rest = model answer
+                eval_text = paragraphs[0] if paragraphs else ""
+                model_text = '\n\n'.join(paragraphs[1:]) if len(paragraphs) > 1 else '\n\n'.join(paragraphs)
+                
+                return (
+                    "### ✅ What's Good\n"
+                    "- Good effort in answering the question\n\n"
+                    "### ⚠️ Areas for Improvement\n"
+                    "- Could provide more detail and examples\n\n"
+                    "### 📝 Model Answer\n"
+                    + model_text + "\n\n"
+                    "### ❓ Follow-up Question\n"
+                    + question_text.strip()
+                )
+    
+    # Last resort: return original content
+    return content
@@ -1,29 +1,193 @@
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, Response, g, stream_with_context
+import hmac
+import json
 import os
-from groq import Groq
-import PyPDF2
-import docx
-import io
+import time
+import uuid
+from .feedback import build_context, build_system_prompt, resolve_prompt_variant
+from .analytics import GROUP_COLUMNS, query_rollups, record_turn
+from .jobs import JobQueue
+from .model_router import ModelRouter, default_routes
+from .usage import UsageTracker, completion_usage, estimate_prompt_tokens, estimate_tokens, estimate_usage
+from .resume import extract_resume_text, preprocess_resume, warm_up as warm_up_resume_parsers
+from .search_index import index_turn, search
+from .transcript import TRANSCRIPT_FORMATS, iter_transcript, iter_txt
+from .traffic import REPLAY_UPSTREAM, ReplayUpstreamClient, looks_like_code, recorder as traffic_recorder
 
 app = Flask(__name__)
 
 # Get API key from environment (Vercel sets this directly)
 groq_api_key = os.environ.get("GROQ_API_KEY") or os.getenv("GROQ_API_KEY")
 
+# Clients keyed by API key; groq is imported on first use to keep cold starts cheap
+groq_clients = {}
+
 def get_groq_client():
-    """Initialize Groq client on each request to ensure API key is available"""
+    """Return a Groq client for the current API key (read on each request so it is always available)"""
+    if REPLAY_UPSTREAM:
+        return ReplayUpstreamClient(request.headers.get('X-Replay-Upstream'))
     api_key = os.environ.get("GROQ_API_KEY") or os.getenv("GROQ_API_KEY")
-    if api_key:
-        return Groq(api_key=api_key)
-    return None
+    if not api_key:
+        return None
+    if api_key not in groq_clients:
+        from groq import Groq
+        groq_clients[api_key] = Groq(api_key=api_key)
+    return groq_clients[api_key]
+
+# System prompt wording (see PROMPT_VARIANTS in feedback.py)
+PROMPT_VARIANT = resolve_prompt_variant(os.environ.get("INTERVIEWER_PROMPT_VARIANT", "api"), "api")
+
+# Large model for evaluations, with the Streamlit app's model as the alternate
+router = ModelRouter(default_routes(
+    os.environ.get("GROQ_LARGE_MODEL", "llama-3.3-70b-versatile"),
+    os.environ.get("GROQ_ALTERNATE_MODEL", "openai/gpt-oss-120b")
+))
 
 # Session storage (in production, use Redis or database)
 sessions = {}
 
+# Token and wall-time accounting per session and per client
+usage_tracker = UsageTracker()
+
+# Background jobs (resume processing); SSE streams send a heartbeat this often (seconds)
+jobs = JobQueue()
+JOB_EVENTS_HEARTBEAT = 15
+
+# Instructor-only endpoints (/api/search) require this token; unset disables them
+INSTRUCTOR_TOKEN = os.environ.get("INSTRUCTOR_TOKEN", "")
+
+# Page size for /api/get-history when the client does not pass a limit
+HISTORY_PAGE_SIZE = 50
+HISTORY_MAX_PAGE_SIZE = 200
+
+def get_session(session_id):
+    """Return the session, creating it with the system prompt and opening question if new"""
+    if session_id not in sessions:
+        sessions[session_id] = {
+            # Distinguishes this session from an earlier one with the same id (e.g. before a restart)
+            "run_id": uuid.uuid4().hex,
+            "messages": [
+                {
+                    "role": "system",
+                    "content": build_system_prompt(variant=PROMPT_VARIANT)
+                },
+                {
+                    "role": "assistant",
+                    "content": "Let's start! Tell me about yourself."
+                }
+            ]
+        }
+    return sessions[session_id]
+
+def numbered_messages(messages, start):
+    """Return messages[start:] tagged with their sequence number (index in the session)"""
+    return [
+        {"seq": seq, "role": m["role"], "content": m["content"]}
+        for seq, m in enumerate(messages[start:], start)
+    ]
+
+def get_client_id():
+    """Identify the caller for per-client quotas (first hop of X-Forwarded-For on Vercel)"""
+    forwarded = request.headers.get('X-Forwarded-For', '')
+    return forwarded.split(',')[0].strip() or request.remote_addr or 'unknown'
+
+@app.before_request
+def start_trace():
+    if traffic_recorder:
+        g.trace = {"t": round(time.time(), 3), "started": time.perf_counter()}
+
+@app.after_request
+def finish_trace(response):
+    """Describe the request for the traffic trace; streamed responses are written once fully sent.
+    
+    Tracing must never change a response: anything unexpected in the request
+    is logged and the request is left out of the trace.
+    """
+    trace = g.get("trace")
+    if trace is None:
+        return response
+    try:
+        describe_request(trace, response)
+    except Exception as e:
+        app.logger.warning("Traffic trace skipped for %s: %s", request.path, e)
+        return response
+    
+    def write():
+        trace["d"] = round((time.perf_counter() - trace.pop("started")) * 1000, 1)
+        try:
+            traffic_recorder.write(trace)
+        except Exception as e:
+            app.logger.warning("Traffic trace write failed: %s", e)
+    
+    if response.is_streamed:
+        response.call_on_close(write)
+    else:
+        write()
+    return response
+
+def describe_request(trace, response):
+    """Fill in the trace keys documented in traffic.py (sizes and hashes only, never content)"""
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        data = request.form or request.args
+    session_id = data.get('session_id')
+    rule = request.url_rule.rule if request.url_rule else None
+    trace.update(
+        m=request.method,
+        p=rule,
+        s=response.status_code,
+        rq=request.content_length or 0,
+        sid=traffic_recorder.anonymize(session_id)
+    )
+    # Measuring a streamed body would buffer it, which delays the response being traced
+    if not response.is_streamed:
+        trace["rs"] = response.calculate_content_length()
+    if isinstance(session_id, str) and session_id in sessions:
+        trace["n"] = sum(1 for m in sessions[session_id]["messages"] if m["role"] == "user")
+    if rule == '/api/chat':
+        message = data.get('message', '')
+        if isinstance(message, str):
+            trace.update(a=len(message), c=looks_like_code(message))
+        trace.update(tp=data.get('topic'), st=bool(data.get('stream')))
+    elif rule == '/api/upload-resume' and 'file' in request.files:
+        upload = request.files['file']
+        trace["f"] = {
+            "x": os.path.splitext(upload.filename or '')[1].lower().lstrip('.'),
+            "b": request.content_length or 0,
+            "w": request.form.get('wait') in ('1', 'true')
+        }
+        if response.status_code == 202:
+            trace["j"] = traffic_recorder.anonymize(response.get_json()["job_id"])
+    elif rule and rule.startswith('/api/jobs/'):
+        trace["j"] = traffic_recorder.anonymize(request.view_args["job_id"])
+    elif rule == '/assets/<name>':
+        trace["x"] = os.path.splitext(request.view_args["name"])[1].lstrip('.')
+    elif rule == '/api/transcript':
+        trace["fmt"] = data.get('format', 'txt')
+
+def is_instructor():
+    """True if the request carries INSTRUCTOR_TOKEN (Authorization: Bearer <token> or X-Instructor-Token)"""
+    auth = request.headers.get('Authorization', '')
+    token = auth[7:] if auth.startswith('Bearer ') else request.headers.get('X-Instructor-Token', '')
+    return bool(INSTRUCTOR_TOKEN) and hmac.compare_digest(token.encode(), INSTRUCTOR_TOKEN.encode())
+
+def static_response(path):
+    """Serve the page shell or a hashed asset with ETag, caching and compression"""
+    from .assets import asset_response_parts
+    parts = asset_response_parts(path, request.headers.get('If-None-Match'), request.headers.get('Accept-Encoding'))
+    if parts is None:
+        return jsonify({"error": "Not found"}), 404
+    status, body, headers = parts
+    # Body is already encoded, so bypass Flask's own conditional handling
+    return Response(body, status=status, headers=headers, direct_passthrough=True)
+
 @app.route('/')
 def index():
-    from .template import HTML_TEMPLATE
-    return HTML_TEMPLATE
+    return static_response('/')
+
+@app.route('/assets/<name>')
+def assets(name):
+    return static_response(f'/assets/{name}')
 
 @app.route('/api/chat', methods=['POST'])
 def chat():
@@ -36,34 +200,30 @@ def chat():
     user_message = data.get('message', '')
     topic = data.get('topic', 'General')
     resume_text = data.get('resume_text', '')
+    cohort = data.get('cohort', 'default')
     
     if not user_message.strip():
         return jsonify({"error": "Message is required"}), 400
     
-    # Initialize or retrieve session
-    if session_id not in sessions:
-        sessions[session_id] = {
-            "messages": [
-                {
-                    "role": "system",
-                    "content": "You are a technical interviewer preparing B.Tech CSE students for internships. "
-                              "When evaluating answers, structure your response EXACTLY as follows:\n\n"
-                              "✅ **What's Good:**\n"
-                              "- [List positive aspects with bullet points]\n\n"
-                              "⚠️ **Areas for Improvement:**\n"
-                              "- [List specific improvements needed]\n\n"
-                              "💡 **Model Answer:**\n"
-                              "[Provide a comprehensive, well-structured answer in a different tone - more formal and complete]\n\n"
-                              "❓ **Follow-up Question:**\n"
-                              "[Ask a relevant follow-up question]\n\n"
-                              "Keep responses clear, concise, and professional. Use proper formatting with line breaks."
-                },
-                {
-                    "role": "assistant",
-                    "content": "Let's start! Tell me about yourself."
-                }
-            ]
-        }
+    session = get_session(session_id)
+    
+    # Legacy clients send the raw resume every turn; condense it once per distinct text
+    if resume_text and session.get("resume_hash") != hash(resume_text):
+        session["resume_hash"] = hash(resume_text)
+        session["resume_profile"] = preprocess_resume(resume_text)["profile_text"]
+    resume_profile = session.get("resume_profile", "")
+    
+    # Enforce quotas before spending anything upstream
+    client_id = get_client_id()
+    quota_error = usage_tracker.check(
+        session_id,
+        client_id,
+        user_message,
+        estimate_prompt_tokens(sessions[session_id]["messages"]) + estimate_tokens(user_message + resume_profile)
+    )
+    if quota_error:
+        message, status = quota_error
+        return jsonify({"error": message}), status
     
     # Add user message
     sessions[session_id]["messages"].append({
@@ -71,90 +231,281 @@ def chat():
         "content": user_message
     })
     
-    # Build context
-    context = ""
-    if resume_text:
-        context += f"\nHere is the candidate's resume:\n{resume_text}\n"
-    if topic != "General":
-        context += f"\nFocus questions on: {topic}\n"
-    
     # Update system prompt with context
-    sessions[session_id]["messages"][0]["content"] = (
-        "You are a technical interviewer preparing B.Tech CSE students for internships. "
-        "When evaluating answers, structure your response EXACTLY as follows:\n\n"
-        "✅ **What's Good:**\n"
-        "- [List positive aspects with bullet points]\n\n"
-        "⚠️ **Areas for Improvement:**\n"
-        "- [List specific improvements needed]\n\n"
-        "💡 **Model Answer:**\n"
-        "[Provide a comprehensive, well-structured answer in a different tone - more formal and complete]\n\n"
-        "❓ **Follow-up Question:**\n"
-        "[Ask a relevant follow-up question]\n\n"
-        "Keep responses clear, concise, and professional. Use proper formatting with line breaks." + context
+    sessions[session_id]["messages"][0]["content"] = build_system_prompt(
+        build_context(resume_profile, topic), variant=PROMPT_VARIANT
     )
     
+    # Answer to the opening question is cheap; everything after is a full evaluation
+    task = "opening" if len(sessions[session_id]["messages"]) <= 3 else "evaluate"
+    
+    # Per-turn details kept for search indexing and analytics
+    meta = {"topic": topic, "cohort": cohort}
+    
+    if data.get('stream'):
+        return Response(
+            stream_with_context(stream_chat(groq_client, task, session_id, client_id, meta)),
+            content_type="application/x-ndjson; charset=utf-8",
+            headers={"Cache-Control": "no-store", "X-Accel-Buffering": "no"}
+        )
+    
     try:
         # Get response from Groq
-        completion = groq_client.chat.completions.create(
-            model="llama-3.3-70b-versatile",
+        started = time.perf_counter()
+        completion, model = router.create(
+            groq_client,
+            task,
             messages=sessions[session_id]["messages"],
             temperature=0.7,
             max_tokens=1024
         )
         
         assistant_message = completion.choices[0].message.content
+        usage = completion_usage(completion) or estimate_usage(sessions[session_id]["messages"], assistant_message)
+        latency = time.perf_counter() - started
+        usage_tracker.record(session_id, client_id, usage, latency)
         
-        # Add assistant response to session
-        sessions[session_id]["messages"].append({
-            "role": "assistant",
-            "content": assistant_message
-        })
-        
-        return jsonify({
-            "response": assistant_message,
-            "messages": sessions[session_id]["messages"][1:]  # exclude system prompt
-        })
+        turn = finish_turn(session_id, assistant_message, dict(meta, model=model, usage=usage, latency=latency))
+        return jsonify(dict(turn, response=assistant_message))
     
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
+def finish_turn(session_id, assistant_message, meta):
+    """Store the assistant reply and describe the new turn (clients resync via /api/get-history).
+    
+    meta holds topic, cohort, model, usage and latency for the turn.
+    """
+    messages = sessions[session_id]["messages"]
+    messages.append({
+        "role": "assistant",
+        "content": assistant_message
+    })
+    
+    trace = g.get("trace")
+    if trace is not None:
+        prompt_tokens, completion_tokens = meta["usage"] or (None, None)
+        trace["u"] = {
+            "ms": round(meta["latency"] * 1000),
+            "pt": prompt_tokens,
+            "ct": completion_tokens,
+            "model": meta["model"]
+        }
+    
+    # Derived data (search index, analytics) must never fail the turn
+    turn = sum(1 for m in messages if m["role"] == "user")
+    answer = messages[-2]["content"]
+    try:
+        index_turn(session_id, turn, meta["topic"], len(messages) - 2, answer, assistant_message)
+    except Exception as e:
+        app.logger.warning("Search indexing failed: %s", e)
+    try:
+        record_turn(
+            session_id, turn, meta["topic"], meta["cohort"], answer, assistant_message, meta["latency"], meta["usage"],
+            run_id=sessions[session_id]["run_id"]
+        )
+    except Exception as e:
+        app.logger.warning("Analytics update failed: %s", e)
+    
+    return {
+        "seq": len(messages) - 1,
+        "model": meta["model"],
+        "turn": numbered_messages(messages, len(messages) - 2)
+    }
+
+def stream_chat(groq_client, task, session_id, client_id, meta):
+    """Yield the reply as NDJSON: {"delta": ...} lines, then the finished turn with "done": true"""
+    try:
+        started = time.perf_counter()
+        completion, model = router.create(
+            groq_client,
+            task,
+            messages=sessions[session_id]["messages"],
+            temperature=0.7,
+            max_tokens=1024,
+            stream=True
+        )
+        
+        assistant_message = ""
+        usage = None
+        for chunk in completion:
+            usage = completion_usage(chunk) or usage  # reported on the last chunk
+            delta = chunk.choices[0].delta.content if chunk.choices else None
+            if delta:
+                assistant_message += delta
+                yield json.dumps({"delta": delta}) + "\n"
+        usage = usage or estimate_usage(sessions[session_id]["messages"], assistant_message)
+        latency = time.perf_counter() - started
+        usage_tracker.record(session_id, client_id, usage, latency)
+        
+        turn = finish_turn(session_id, assistant_message, dict(meta, model=model, usage=usage, latency=latency))
+        yield json.dumps(dict(turn, done=True)) + "\n"
+    
+    except Exception as e:
+        yield json.dumps({"error": str(e)}) + "\n"
+
+@app.route('/api/search', methods=['GET'])
+def search_transcripts():
+    """Ranked snippets from indexed turns (instructors only); filter with topic and section, any=1 to match any word"""
+    if not is_instructor():
+        return jsonify({"error": "Instructor token required"}), 403
+    query = request.args.get('q', '')
+    if not query.strip():
+        return jsonify({"error": "Query parameter q is required"}), 400
+    try:
+        limit = min(max(int(request.args.get('limit', 20)), 1), 100)
+    except ValueError:
+        return jsonify({"error": "limit must be an integer"}), 400
+    
+    started = time.perf_counter()
+    results = search(
+        query,
+        topic=request.args.get('topic'),
+        section=request.args.get('section'),
+        limit=limit,
+        match_any=request.args.get('any') in ('1', 'true')
+    )
+    return jsonify({"results": results, "took_ms": round((time.perf_counter() - started) * 1000, 2)})
+
+@app.route('/api/analytics', methods=['GET'])
+def analytics():
+    """Per-topic/day/cohort rollups, e.g. ?group_by=topic,day&since=2026-01-01&cohort=cse-a"""
+    group_by = [c.strip() for c in request.args.get('group_by', 'topic').split(',') if c.strip()]
+    if not group_by or any(c not in GROUP_COLUMNS for c in group_by):
+        return jsonify({"error": f"group_by must be a comma-separated list of: {', '.join(GROUP_COLUMNS)}"}), 400
+    
+    rollups = query_rollups(
+        group_by,
+        since=request.args.get('since'),
+        until=request.args.get('until'),
+        topic=request.args.get('topic'),
+        cohort=request.args.get('cohort')
+    )
+    return jsonify({"group_by": group_by, "rollups": rollups})
+
+@app.route('/api/model-stats', methods=['GET'])
+def model_stats():
+    return jsonify({"routes": router.routes, "models": router.stats()})
+
+@app.route('/api/usage', methods=['GET', 'POST'])
+def usage():
+    data = request.get_json(silent=True) or request.args
+    session_id = data.get('session_id', 'default')
+    return jsonify(usage_tracker.summary(session_id, get_client_id()))
+
 @app.route('/api/upload-resume', methods=['POST'])
 def upload_resume():
+    """Queue resume extraction and profile building; poll /api/jobs/<job_id> for the result.
+    
+    Pass wait=1 to process synchronously (for hosts that stop background
+    threads once the response is sent).
+    """
     if 'file' not in request.files:
         return jsonify({"error": "No file provided"}), 400
     
     file = request.files['file']
+    if not file.filename.lower().endswith(('.pdf', '.docx')):
+        return jsonify({"error": "Unsupported file type"}), 400
     
-    try:
-        if file.filename.endswith('.pdf'):
-            pdf_reader = PyPDF2.PdfReader(io.BytesIO(file.read()))
-            text = ""
-            for page in pdf_reader.pages:
-                text += page.extract_text() + "\n"
-            return jsonify({"text": text})
-        
-        elif file.filename.endswith('.docx'):
-            doc = docx.Document(io.BytesIO(file.read()))
-            text = "\n".join([para.text for para in doc.paragraphs])
-            return jsonify({"text": text})
-        
-        else:
-            return jsonify({"error": "Unsupported file type"}), 400
+    data = file.read()
+    session_id = request.form.get('session_id')
     
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    def store_profile(resume):
+        # The session's profile replaces the raw text in every later prompt
+        if session_id:
+            get_session(session_id)["resume_profile"] = resume["profile_text"]
+    
+    if request.form.get('wait') in ('1', 'true'):
+        try:
+            resume = process_resume(file.filename, data)
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+        store_profile(resume)
+        return jsonify({"status": "done", "result": resume})
+    
+    job_id = jobs.submit(process_resume, file.filename, data, on_done=store_profile)
+    return jsonify({"job_id": job_id, "status": "queued"}), 202
+
+@app.route('/api/jobs/<job_id>', methods=['GET'])
+def job_status(job_id):
+    job = jobs.get(job_id)
+    if job is None:
+        return jsonify({"error": "Unknown job"}), 404
+    return jsonify(job)
+
+@app.route('/api/jobs/<job_id>/events', methods=['GET'])
+def job_events(job_id):
+    """Server-sent events: the current status, then the final status once the job finishes"""
+    job = jobs.get(job_id)
+    if job is None:
+        return jsonify({"error": "Unknown job"}), 404
+    
+    def events():
+        current = job
+        yield f"data: {json.dumps(current)}\n\n"
+        while current is not None and current["status"] in ("queued", "running"):
+            current = jobs.wait(job_id, JOB_EVENTS_HEARTBEAT)
+            if current is None or current["status"] in ("queued", "running"):
+                yield ": keep-alive\n\n"
+            else:
+                yield f"data: {json.dumps(current)}\n\n"
+    
+    return Response(
+        stream_with_context(events()),
+        content_type="text/event-stream",
+        headers={"Cache-Control": "no-store", "X-Accel-Buffering": "no"}
+    )
+
+def process_resume(filename, data):
+    """Background job: extract the resume text and condense it into a profile"""
+    text = extract_resume_text(filename, data)
+    if not text or not text.strip():
+        raise ValueError("No text could be extracted from the resume")
+    return preprocess_resume(text)
+
+@app.route('/api/warmup', methods=['GET', 'POST'])
+def warmup():
+    """Pre-load the LLM client, document parsers and compressed page assets (e.g. from a cron ping)"""
+    timings = {}
+    
+    started = time.perf_counter()
+    get_groq_client()
+    timings["groq_client_ms"] = round((time.perf_counter() - started) * 1000, 1)
+    
+    started = time.perf_counter()
+    warm_up_resume_parsers()
+    timings["resume_parsers_ms"] = round((time.perf_counter() - started) * 1000, 1)
+    
+    started = time.perf_counter()
+    from .assets import get_assets
+    get_assets()
+    timings["assets_ms"] = round((time.perf_counter() - started) * 1000, 1)
+    
+    return jsonify({"status": "warm", "timings": timings})
 
 @app.route('/api/get-history', methods=['POST'])
 def get_history():
     data = request.json
     session_id = data.get('session_id', 'default')
     
-    if session_id in sessions:
-        return jsonify({
-            "messages": sessions[session_id]["messages"][1:]  # exclude system prompt
-        })
+    try:
+        after_seq = max(int(data.get('after_seq', 0)), 0)
+        limit = min(max(int(data.get('limit', HISTORY_PAGE_SIZE)), 1), HISTORY_MAX_PAGE_SIZE)
+    except (TypeError, ValueError):
+        return jsonify({"error": "after_seq and limit must be integers"}), 400
+    
+    if session_id not in sessions:
+        return jsonify({"messages": [], "last_seq": 0, "has_more": False})
+    
+    messages = sessions[session_id]["messages"]
+    start = after_seq + 1  # seq 0 is the system prompt
+    page = numbered_messages(messages[:start + limit], start)
     
-    return jsonify({"messages": []})
+    return jsonify({
+        "messages": page,
+        "last_seq": page[-1]["seq"] if page else after_seq,
+        "has_more": start + limit < len(messages)
+    })
 
 @app.route('/api/download-transcript', methods=['POST'])
 def download_transcript():
@@ -164,12 +515,35 @@ def download_transcript():
     if session_id not in sessions:
         return jsonify({"error": "No conversation found"}), 404
     
-    transcript = "\n".join([
-        f"{'Interviewer' if m['role']=='assistant' else 'You'}: {m['content']}"
-        for m in sessions[session_id]["messages"][1:]  # skip system prompt
-    ])
+    transcript = "".join(iter_txt(sessions[session_id]["messages"][1:]))  # skip system prompt
     
     return jsonify({"transcript": transcript})
 
+@app.route('/api/transcript', methods=['GET', 'POST'])
+def export_transcript():
+    """Stream the transcript as a chunked file download (txt, md or jsonl)"""
+    data = request.get_json(silent=True) or request.args
+    session_id = data.get('session_id', 'default')
+    fmt = data.get('format', 'txt')
+    
+    if fmt not in TRANSCRIPT_FORMATS:
+        return jsonify({"error": f"Unsupported format. Use one of: {', '.join(TRANSCRIPT_FORMATS)}"}), 400
+    if session_id not in sessions:
+        return jsonify({"error": "No conversation found"}), 404
+    
+    # Slicing snapshots the list so turns added mid-download don't affect the export
+    messages = sessions[session_id]["messages"][1:]  # skip system prompt
+    content_type, extension = TRANSCRIPT_FORMATS[fmt]
+    
+    return Response(
+        stream_with_context(iter_transcript(messages, fmt)),
+        content_type=content_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="interview_transcript.{extension}"',
+            "Cache-Control": "no-store",
+            "X-Content-Type-Options": "nosniff"
+        }
+    )
+
 if __name__ == '__main__':
     app.run(debug=True)
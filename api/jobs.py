@@ -0,0 +1,80 @@
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+# Worker threads for background jobs and how long finished jobs stay pollable
+JOB_WORKERS = int(os.environ.get("JOB_WORKERS", "2"))
+JOB_TTL = float(os.environ.get("JOB_TTL", "3600"))  # seconds
+
+class JobQueue:
+    """In-process job queue backed by a small thread pool.
+
+    Jobs live in memory, like sessions, so status is only visible on the
+    instance that accepted the job.
+    """
+
+    def __init__(self, workers=JOB_WORKERS):
+        self.workers = workers
+        self.executor = None  # started on first submit
+        self.jobs = {}
+        self.lock = threading.Lock()
+
+    def submit(self, fn, *args, on_done=None):
+        """Queue fn(*args); on_done(result) runs in the worker once it succeeds. Returns the job id."""
+        job_id = uuid.uuid4().hex
+        with self.lock:
+            self._prune()
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="job")
+            self.jobs[job_id] = {
+                "status": "queued",
+                "created": time.time(),
+                "finished": None,
+                "result": None,
+                "error": None,
+                "event": threading.Event(),
+            }
+        self.executor.submit(self._run, job_id, fn, args, on_done)
+        return job_id
+
+    def _run(self, job_id, fn, args, on_done):
+        job = self.jobs[job_id]
+        job["status"] = "running"
+        try:
+            result = fn(*args)
+            if on_done is not None:
+                on_done(result)
+        except Exception as e:
+            job["error"] = str(e)
+            job["status"] = "failed"
+        else:
+            job["result"] = result
+            job["status"] = "done"
+        job["finished"] = time.time()
+        job["event"].set()
+
+    def _prune(self):
+        cutoff = time.time() - JOB_TTL
+        for job_id in [j for j, job in self.jobs.items() if job["finished"] and job["finished"] < cutoff]:
+            del self.jobs[job_id]
+
+    def get(self, job_id):
+        """Public view of a job, or None if unknown or expired"""
+        job = self.jobs.get(job_id)
+        if job is None:
+            return None
+        view = {"job_id": job_id, "status": job["status"]}
+        if job["status"] == "done":
+            view["result"] = job["result"]
+        elif job["status"] == "failed":
+            view["error"] = job["error"]
+        return view
+
+    def wait(self, job_id, timeout):
+        """Block until the job finishes or timeout passes; returns the job view"""
+        job = self.jobs.get(job_id)
+        if job is not None:
+            job["event"].wait(timeout)
+        return self.get(job_id)
@@ -0,0 +1,117 @@
+import json
+import os
+import threading
+import time
+from collections import deque
+
+# Small, fast model for cheap tasks; override with environment variables
+FAST_MODEL = os.environ.get("GROQ_FAST_MODEL", "llama-3.1-8b-instant")
+
+# Rolling window and thresholds used to decide when a model is unhealthy
+WINDOW_SIZE = int(os.environ.get("ROUTER_WINDOW_SIZE", "20"))
+MIN_SAMPLES = int(os.environ.get("ROUTER_MIN_SAMPLES", "3"))
+MAX_AVG_LATENCY = float(os.environ.get("ROUTER_MAX_AVG_LATENCY", "20"))  # seconds
+MAX_ERROR_RATE = float(os.environ.get("ROUTER_MAX_ERROR_RATE", "0.5"))
+COOLDOWN = float(os.environ.get("ROUTER_COOLDOWN", "60"))  # seconds before an unhealthy model is retried
+REQUEST_TIMEOUT = float(os.environ.get("ROUTER_REQUEST_TIMEOUT", "60"))  # seconds per upstream call
+
+def default_routes(large_model, alternate_model):
+    """Task -> models to try in order. MODEL_ROUTES (JSON) overrides individual tasks."""
+    routes = {
+        # Reply to the opening "Tell me about yourself" answer
+        "opening": [FAST_MODEL, large_model],
+        # Full four-section evaluation of a technical answer
+        "evaluate": [large_model, alternate_model, FAST_MODEL],
+        # Rewriting a reply that came back in the wrong format
+        "repair": [FAST_MODEL, large_model],
+    }
+    routes.update(json.loads(os.environ.get("MODEL_ROUTES", "{}")))
+    return routes
+
+class ModelRouter:
+    """Pick a model per task and fail over when the preferred one is slow or erroring"""
+
+    def __init__(self, routes):
+        self.routes = routes
+        self.samples = {}  # model -> deque of (latency seconds, succeeded)
+        self.benched_until = {}  # model -> time it may be tried again
+        self.lock = threading.Lock()
+
+    def record(self, model, latency, ok):
+        with self.lock:
+            window = self.samples.setdefault(model, deque(maxlen=WINDOW_SIZE))
+            window.append((latency, ok))
+            if not self._healthy(window):
+                self.benched_until[model] = time.monotonic() + COOLDOWN
+
+    def _healthy(self, window):
+        if len(window) < MIN_SAMPLES:
+            return True
+        avg_latency = sum(latency for latency, _ in window) / len(window)
+        error_rate = sum(1 for _, ok in window if not ok) / len(window)
+        return avg_latency <= MAX_AVG_LATENCY and error_rate <= MAX_ERROR_RATE
+
+    def candidates(self, task):
+        """Models for task in preference order, benched models moved to the end"""
+        models = self.routes.get(task) or self.routes["evaluate"]
+        now = time.monotonic()
+        healthy, benched = [], []
+        with self.lock:
+            for model in models:
+                until = self.benched_until.get(model)
+                if until is None:
+                    healthy.append(model)
+                elif until <= now:
+                    # Cooldown over: forget old samples and give the model another chance
+                    del self.benched_until[model]
+                    self.samples.pop(model, None)
+                    healthy.append(model)
+                else:
+                    benched.append(model)
+        return healthy + benched
+
+    def create(self, client, task, **kwargs):
+        """Run a chat completion for task, falling back through its models.
+
+        Returns (completion, model). Streams are wrapped so the model's latency
+        and success are recorded when the stream ends or fails part-way through.
+        """
+        kwargs.setdefault("timeout", REQUEST_TIMEOUT)
+        last_error = None
+        for model in self.candidates(task):
+            start = time.perf_counter()
+            try:
+                completion = client.chat.completions.create(model=model, **kwargs)
+            except Exception as e:
+                self.record(model, time.perf_counter() - start, False)
+                last_error = e
+                continue
+            if kwargs.get("stream"):
+                return self._recorded_stream(model, completion, start), model
+            self.record(model, time.perf_counter() - start, True)
+            return completion, model
+        raise last_error
+
+    def _recorded_stream(self, model, stream, start):
+        # A consumer that stops early (client disconnect) raises GeneratorExit, which isn't the model's fault
+        try:
+            for chunk in stream:
+                yield chunk
+        except Exception:
+            self.record(model, time.perf_counter() - start, False)
+            raise
+        self.record(model, time.perf_counter() - start, True)
+
+    def stats(self):
+        """Rolling latency and error rate per model"""
+        now = time.monotonic()
+        with self.lock:
+            return {
+                model: {
+                    "samples": len(window),
+                    "avg_latency_ms": round(sum(l for l, _ in window) / len(window) * 1000) if window else None,
+                    "error_rate": round(sum(1 for _, ok in window if not ok) / len(window), 3) if window else None,
+                    "benched": self.benched_until.get(model, 0) > now,
+                }
+                for model, window in self.samples.items()
+            }
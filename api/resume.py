@@ -0,0 +1,213 @@
+import io
+import os
+import re
+
+from .usage import estimate_tokens
+
+# Document parsers are imported on first use: they are slow to import and
+# most requests never touch a resume.
+
+def extract_pdf_text(data):
+    import PyPDF2
+    pdf_reader = PyPDF2.PdfReader(io.BytesIO(data))
+    text = ""
+    for page in pdf_reader.pages:
+        text += page.extract_text() + "\n"
+    return text
+
+def extract_docx_text(data):
+    import docx
+    doc = docx.Document(io.BytesIO(data))
+    return "\n".join([para.text for para in doc.paragraphs])
+
+def extract_resume_text(filename, data):
+    """Return the raw text of a PDF or DOCX resume, or None for unsupported files"""
+    name = filename.lower()
+    if name.endswith('.pdf'):
+        return extract_pdf_text(data)
+    if name.endswith('.docx'):
+        return extract_docx_text(data)
+    return None
+
+def warm_up():
+    """Import the document parsers ahead of the first upload"""
+    import PyPDF2  # noqa: F401
+    import docx  # noqa: F401
+
+# --- Compact profile ---
+# The raw resume (contact block, page headers, whitespace runs) used to be
+# appended to the system prompt on every turn. It is condensed once at upload
+# into a short structured profile that is sent instead.
+
+# Token budget for the rendered profile; override with RESUME_PROFILE_TOKENS
+PROFILE_TOKEN_BUDGET = int(os.environ.get("RESUME_PROFILE_TOKENS", "350"))
+
+# Section heading keywords -> profile field
+SECTION_HEADINGS = {
+    "skills": "skills",
+    "technical skills": "skills",
+    "core competencies": "skills",
+    "projects": "projects",
+    "academic projects": "projects",
+    "personal projects": "projects",
+    "experience": "experience",
+    "work experience": "experience",
+    "internships": "experience",
+    "internship": "experience",
+    "education": "education",
+    "academic background": "education",
+    "certifications": "other",
+    "achievements": "other",
+    "awards": "other",
+    "activities": "other",
+    "extracurricular activities": "other",
+    "positions of responsibility": "other",
+    "summary": "other",
+    "objective": "other",
+    "career objective": "other",
+    "hobbies": "ignore",
+    "interests": "ignore",
+    "languages": "ignore",
+    "declaration": "ignore",
+    "references": "ignore",
+    "contact": "ignore",
+    "personal details": "ignore",
+}
+
+# Technologies picked up from anywhere in the resume (matched case-insensitively as whole words,
+# except AMBIGUOUS_TECHNOLOGIES)
+KNOWN_TECHNOLOGIES = (
+    "Python", "Java", "C++", "C#", "C", "JavaScript", "TypeScript", "Go", "Rust", "Kotlin", "Swift", "PHP",
+    "SQL", "MySQL", "PostgreSQL", "MongoDB", "SQLite", "Redis", "Firebase",
+    "React", "Angular", "Vue", "Node.js", "Express", "Django", "Flask", "FastAPI", "Spring", "Spring Boot",
+    "HTML", "CSS", "Tailwind", "Bootstrap", "Next.js",
+    "TensorFlow", "PyTorch", "Keras", "scikit-learn", "Pandas", "NumPy", "OpenCV", "NLP",
+    "Docker", "Kubernetes", "AWS", "GCP", "Azure", "Linux", "Git", "GitHub", "CI/CD",
+    "Android", "Flutter", "React Native", "Streamlit", "REST", "GraphQL",
+)
+
+# Names that are also ordinary words ("go to events", "rest under load") only count with exact case
+AMBIGUOUS_TECHNOLOGIES = {"C", "Go", "Rust", "Swift", "Vue", "Express", "Spring", "React", "Angular", "Flask", "REST"}
+
+CONTACT_RE = re.compile(
+    r"[\w.+-]+@[\w-]+\.[\w.]+|\+?\d(?:[\s()-]*\d){9,}|https?://\S+|www\.\S+|linkedin\.com\S*|github\.com\S*",
+    re.IGNORECASE
+)
+BULLET_RE = re.compile(r"^[\s•▪●◦*·\-–]+")
+ITEM_SPLIT_RE = re.compile(r"\s*(?:,|;|\||•|·|▪|/(?=\s))\s*")
+
+def normalize_whitespace(text):
+    """Collapse whitespace runs, trim lines and drop blank lines"""
+    lines = (re.sub(r"\s+", " ", line).strip() for line in text.splitlines())
+    return "\n".join(line for line in lines if line)
+
+def heading_field(line):
+    """Profile field for a section heading line, or None if the line is not a heading"""
+    key = re.sub(r"[^a-z ]", "", line.lower()).strip()
+    if len(line) > 40 or not key:
+        return None
+    return SECTION_HEADINGS.get(key)
+
+def split_sections(text):
+    """Group resume lines by profile field; lines before the first heading are the header block"""
+    sections = {}
+    field = "header"
+    for line in text.splitlines():
+        heading = heading_field(line)
+        if heading:
+            field = heading
+            continue
+        sections.setdefault(field, []).append(line)
+    return sections
+
+def find_technologies(text):
+    found = []
+    for tech in KNOWN_TECHNOLOGIES:
+        flags = 0 if tech in AMBIGUOUS_TECHNOLOGIES else re.IGNORECASE
+        if re.search(r"(?<![\w+#.])" + re.escape(tech) + r"(?![\w+#])", text, flags):
+            found.append(tech)
+    return found
+
+def clean_line(line):
+    return CONTACT_RE.sub("", BULLET_RE.sub("", line)).strip(" :-|,")
+
+def build_profile(text):
+    """Extract skills, technologies, projects, experience and education from resume text"""
+    sections = split_sections(normalize_whitespace(text))
+    skills = []
+    for line in sections.get("skills", []):
+        # "Languages: Python, Java" -> keep the items, drop the label
+        items = line.split(":", 1)[-1]
+        for item in ITEM_SPLIT_RE.split(clean_line(items)):
+            if item and item.lower() not in (s.lower() for s in skills):
+                skills.append(item)
+
+    def entries(field):
+        return [line for line in (clean_line(l) for l in sections.get(field, [])) if len(line) > 2]
+
+    # Hobbies, interests and the like are full of words that look like tech ("Swift swimmer");
+    # only fall back to the whole text when the resume has no headings at all
+    body = "\n".join(
+        line for field, lines in sections.items() if field not in ("header", "ignore") for line in lines
+    )
+    if not body and set(sections) <= {"header"}:
+        body = text
+    return {
+        "skills": skills,
+        "technologies": [t for t in find_technologies(body) if t.lower() not in (s.lower() for s in skills)],
+        "projects": entries("projects"),
+        "experience": entries("experience"),
+        "education": entries("education"),
+    }
+
+def render_profile(profile, token_budget=PROFILE_TOKEN_BUDGET):
+    """Render the profile as compact text, adding items in priority order until the budget is used"""
+    lines = []
+    used = 0
+
+    def add(line):
+        nonlocal used
+        cost = estimate_tokens(line) + 1
+        if used + cost > token_budget:
+            return False
+        lines.append(line)
+        used += cost
+        return True
+
+    for label, field in (("Skills", "skills"), ("Technologies", "technologies")):
+        items = []
+        for item in profile[field]:
+            if estimate_tokens(f"{label}: " + ", ".join(items + [item])) + used > token_budget:
+                break
+            items.append(item)
+        if items:
+            add(f"{label}: " + ", ".join(items))
+    for label, field in (("Projects", "projects"), ("Experience", "experience"), ("Education", "education")):
+        if profile[field] and add(f"{label}:"):
+            added = 0
+            for entry in profile[field]:
+                if not add(f"- {entry[:200]}"):
+                    break
+                added += 1
+            if not added:
+                used -= estimate_tokens(lines.pop()) + 1  # no room for any entry; drop the dangling label
+    return "\n".join(lines)
+
+def preprocess_resume(text, token_budget=PROFILE_TOKEN_BUDGET):
+    """Condense raw resume text once; returns the profile, its prompt text and token stats"""
+    profile = build_profile(text)
+    profile_text = render_profile(profile, token_budget)
+    if not profile_text:
+        # No recognisable sections: fall back to the whitespace-normalised text, cut to budget
+        profile_text = normalize_whitespace(CONTACT_RE.sub("", text))[:token_budget * 4]
+    raw_tokens = estimate_tokens(text)
+    profile_tokens = estimate_tokens(profile_text)
+    return {
+        "profile": profile,
+        "profile_text": profile_text,
+        "stats": {
+            "raw_tokens": raw_tokens,
+            "profile_tokens": profile_tokens,
+            "tokens_saved_per_turn": max(raw_tokens - profile_tokens, 0),
+        },
+    }
@@ -0,0 +1,102 @@
+import hashlib
+import os
+import re
+import secrets
+
+from .feedback import split_sections
+from .storage import connect
+
+# Set SEARCH_INDEX=0 to stop indexing turns
+SEARCH_ENABLED = os.environ.get("SEARCH_INDEX", "1") != "0"
+
+# Search results identify sessions by a salted hash: a raw session id is all
+# /api/get-history and /api/transcript ask for. Set SEARCH_SESSION_SALT to keep
+# hashes stable across restarts.
+SESSION_SALT = os.environ.get("SEARCH_SESSION_SALT") or secrets.token_hex(16)
+
+SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS turn_text USING fts5(
+    content,
+    session_id UNINDEXED,
+    turn UNINDEXED,
+    seq UNINDEXED,
+    topic UNINDEXED,
+    section UNINDEXED,
+    role UNINDEXED,
+    tokenize = 'porter unicode61'
+)
+"""
+
+_ready = False
+
+def get_db():
+    global _ready
+    conn, lock = connect("search")
+    if not _ready:
+        with lock:
+            conn.execute(SCHEMA)
+            conn.commit()
+        _ready = True
+    return conn, lock
+
+def index_turn(session_id, turn, topic, answer_seq, answer, reply):
+    """Index one question/answer turn: the student's answer plus each section of the reply"""
+    if not SEARCH_ENABLED:
+        return
+    rows = [(answer, session_id, turn, answer_seq, topic, "answer", "user")]
+    rows += [
+        (text, session_id, turn, answer_seq + 1, topic, section, "assistant")
+        for section, text in split_sections(reply)
+    ]
+    conn, lock = get_db()
+    with lock:
+        conn.executemany(
+            "INSERT INTO turn_text (content, session_id, turn, seq, topic, section, role) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            rows
+        )
+        conn.commit()
+
+def session_hash(session_id):
+    return hashlib.sha256((SESSION_SALT + session_id).encode("utf-8")).hexdigest()[:16]
+
+def to_match_query(query, match_any=False):
+    """Turn free text into a safe FTS5 query: each word quoted, joined by AND (or OR)"""
+    words = re.findall(r"\w+", query)
+    return (" OR " if match_any else " ").join(f'"{word}"' for word in words)
+
+def search(query, topic=None, section=None, limit=20, match_any=False):
+    """Ranked turn snippets matching query, best first (sessions identified by session_hash)"""
+    match = to_match_query(query, match_any)
+    if not match:
+        return []
+    sql = (
+        "SELECT session_id, turn, seq, topic, section, role, "
+        "snippet(turn_text, 0, '[', ']', '…', 16), bm25(turn_text) "
+        "FROM turn_text WHERE turn_text MATCH ?"
+    )
+    params = [match]
+    if topic:
+        sql += " AND topic = ?"
+        params.append(topic)
+    if section:
+        sql += " AND section = ?"
+        params.append(section)
+    sql += " ORDER BY bm25(turn_text) LIMIT ?"
+    params.append(limit)
+
+    conn, lock = get_db()
+    with lock:
+        rows = conn.execute(sql, params).fetchall()
+    return [
+        {
+            "session": session_hash(session_id),
+            "turn": turn,
+            "seq": seq,
+            "topic": topic,
+            "section": section,
+            "role": role,
+            "snippet": snippet,
+            "score": round(-rank, 4),
+        }
+        for session_id, turn, seq, topic, section, role, snippet, rank in rows
+    ]
@@ -0,0 +1,26 @@
+import os
+import sqlite3
+import tempfile
+import threading
+
+# Local SQLite files for derived data (search index, analytics). /tmp is the
+# only writable path on Vercel, so data there lasts as long as the instance.
+DATA_DIR = os.environ.get("INTERVIEW_DATA_DIR") or os.path.join(tempfile.gettempdir(), "interviewer")
+
+_connections = {}
+_connections_lock = threading.Lock()
+
+def connect(name):
+    """Return (connection, lock) for DATA_DIR/<name>.db, shared by all threads in the process.
+
+    Hold the lock for every statement; sqlite3 connections are not safe for
+    concurrent use.
+    """
+    with _connections_lock:
+        if name not in _connections:
+            os.makedirs(DATA_DIR, exist_ok=True)
+            conn = sqlite3.connect(os.path.join(DATA_DIR, f"{name}.db"), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            _connections[name] = (conn, threading.Lock())
+        return _connections[name]
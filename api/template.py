@@ -1,161 +1,515 @@
-HTML_TEMPLATE = """<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>AI Interview Coach</title>
-    <style>
-        * { margin: 0; padding: 0; box-sizing: border-box; }
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            padding: 20px;
-        }
-        .container {
-            max-width: 900px;
-            margin: 0 auto;
-            background: white;
-            border-radius: 15px;
-            box-shadow: 0 10px 40px rgba(0, 0, 0, 0.2);
-            overflow: hidden;
-        }
-        .header {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 30px;
-            text-align: center;
-        }
-        .header h1 { font-size: 2.5em; margin-bottom: 10px; }
-        .controls {
-            padding: 20px;
-            background: #f8f9fa;
-            border-bottom: 1px solid #dee2e6;
-        }
-        .control-group { margin-bottom: 15px; }
-        .control-group label {
-            display: block;
-            margin-bottom: 5px;
-            font-weight: 600;
-            color: #495057;
-        }
-        select, input[type="file"] {
-            width: 100%;
-            padding: 10px;
-            border: 2px solid #dee2e6;
-            border-radius: 8px;
-            font-size: 1em;
-            transition: border-color 0.3s;
-        }
-        select:focus, input[type="file"]:focus {
-            outline: none;
-            border-color: #667eea;
-        }
-        .conversation {
-            padding: 20px;
-            max-height: 500px;
-            overflow-y: auto;
-            background: #ffffff;
-        }
-        .message {
-            margin-bottom: 20px;
-            padding: 15px;
-            border-radius: 10px;
-            animation: fadeIn 0.3s;
-        }
-        @keyframes fadeIn {
-            from { opacity: 0; transform: translateY(10px); }
-            to { opacity: 1; transform: translateY(0); }
-        }
-        .message.interviewer {
-            background: #e3f2fd;
-            border-left: 4px solid #2196f3;
-        }
-        .message.user {
-            background: #f3e5f5;
-            border-left: 4px solid #9c27b0;
-        }
-        .message strong {
-            display: block;
-            margin-bottom: 5px;
-            color: #495057;
-        }
-        .input-section {
-            padding: 20px;
-            background: #f8f9fa;
-            border-top: 1px solid #dee2e6;
-        }
-        textarea {
-            width: 100%;
-            padding: 15px;
-            border: 2px solid #dee2e6;
-            border-radius: 8px;
-            font-size: 1em;
-            resize: vertical;
-            min-height: 100px;
-            font-family: inherit;
-            transition: border-color 0.3s;
+# Page shell plus its stylesheet and script. The shell references the assets
+# through placeholders that api/assets.py replaces with content-hashed URLs.
+
+STYLES = r"""* { margin: 0; padding: 0; box-sizing: border-box; }
+body {
+    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    min-height: 100vh;
+    padding: 20px;
+}
+.container {
+    max-width: 900px;
+    margin: 0 auto;
+    background: white;
+    border-radius: 15px;
+    box-shadow: 0 10px 40px rgba(0, 0, 0, 0.2);
+    overflow: hidden;
+}
+.header {
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    color: white;
+    padding: 30px;
+    text-align: center;
+}
+.header h1 { font-size: 2.5em; margin-bottom: 10px; }
+.controls {
+    padding: 20px;
+    background: #f8f9fa;
+    border-bottom: 1px solid #dee2e6;
+}
+.control-group { margin-bottom: 15px; }
+.control-group label {
+    display: block;
+    margin-bottom: 5px;
+    font-weight: 600;
+    color: #495057;
+}
+select, input[type="file"] {
+    width: 100%;
+    padding: 10px;
+    border: 2px solid #dee2e6;
+    border-radius: 8px;
+    font-size: 1em;
+    transition: border-color 0.3s;
+}
+select:focus, input[type="file"]:focus {
+    outline: none;
+    border-color: #667eea;
+}
+.conversation {
+    padding: 20px;
+    max-height: 500px;
+    overflow-y: auto;
+    background: #ffffff;
+}
+.message {
+    margin-bottom: 20px;
+    padding: 15px;
+    border-radius: 10px;
+    animation: fadeIn 0.3s;
+}
+@keyframes fadeIn {
+    from { opacity: 0; transform: translateY(10px); }
+    to { opacity: 1; transform: translateY(0); }
+}
+.message.interviewer {
+    background: #e3f2fd;
+    border-left: 4px solid #2196f3;
+}
+.message.user {
+    background: #f3e5f5;
+    border-left: 4px solid #9c27b0;
+}
+.message strong {
+    display: block;
+    margin-bottom: 5px;
+    color: #495057;
+}
+.message-body { line-height: 1.6; }
+.message.user .message-body { white-space: pre-wrap; }
+.message.restored { animation: none; }
+.message-body p, .message-body ul, .message-body ol, .message-body pre { margin: 6px 0; }
+.message-body ul, .message-body ol { padding-left: 22px; }
+.message-body pre {
+    background: #263238;
+    color: #eceff1;
+    padding: 10px;
+    border-radius: 6px;
+    overflow-x: auto;
+}
+.message-body code { font-family: SFMono-Regular, Consolas, monospace; font-size: 0.9em; }
+.md-pending { white-space: pre-wrap; }
+.fb-section {
+    margin: 10px 0;
+    padding: 10px 12px;
+    border-radius: 8px;
+    background: #ffffff;
+    border-left: 4px solid #adb5bd;
+}
+.fb-section h4 { margin-bottom: 6px; color: #343a40; }
+.fb-good { border-left-color: #2e7d32; }
+.fb-improve { border-left-color: #ef6c00; }
+.fb-model { border-left-color: #2c5aa0; background: #e8f4f8; }
+.fb-followup { border-left-color: #6a1b9a; }
+.show-earlier {
+    display: block;
+    width: 100%;
+    margin-bottom: 15px;
+    padding: 8px;
+    background: #f1f3f5;
+    color: #495057;
+}
+.input-section {
+    padding: 20px;
+    background: #f8f9fa;
+    border-top: 1px solid #dee2e6;
+}
+textarea {
+    width: 100%;
+    padding: 15px;
+    border: 2px solid #dee2e6;
+    border-radius: 8px;
+    font-size: 1em;
+    resize: vertical;
+    min-height: 100px;
+    font-family: inherit;
+    transition: border-color 0.3s;
+}
+textarea:focus {
+    outline: none;
+    border-color: #667eea;
+}
+.buttons {
+    display: flex;
+    gap: 10px;
+    margin-top: 10px;
+}
+button {
+    padding: 12px 24px;
+    font-size: 1em;
+    border: none;
+    border-radius: 8px;
+    cursor: pointer;
+    font-weight: 600;
+    transition: all 0.3s;
+}
+.btn-primary {
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    color: white;
+    flex: 1;
+}
+.btn-primary:hover {
+    transform: translateY(-2px);
+    box-shadow: 0 5px 15px rgba(102, 126, 234, 0.4);
+}
+.btn-secondary {
+    background: #6c757d;
+    color: white;
+}
+select.transcript-format {
+    width: auto;
+}
+.btn-secondary:hover {
+    background: #5a6268;
+}
+button:disabled {
+    opacity: 0.6;
+    cursor: not-allowed;
+}
+.loading {
+    text-align: center;
+    padding: 20px;
+    color: #667eea;
+}
+.error {
+    background: #ffebee;
+    color: #c62828;
+    padding: 15px;
+    border-radius: 8px;
+    margin: 10px 0;
+    border-left: 4px solid #c62828;
+}
+.success {
+    background: #e8f5e9;
+    color: #2e7d32;
+    padding: 15px;
+    border-radius: 8px;
+    margin: 10px 0;
+    border-left: 4px solid #2e7d32;
+}
+"""
+
+SCRIPT = r"""let sessionId = 'session_' + Date.now();
+// Instructors share links like /?cohort=cse-a so analytics can be split by class
+const cohort = new URLSearchParams(window.location.search).get('cohort') || 'default';
+
+// Only the most recent messages stay in the DOM; older ones live in `messages` and can be re-shown
+const MAX_RENDERED_MESSAGES = 20;
+const EARLIER_PAGE_SIZE = 10;
+const messages = [];
+let firstRendered = 0;  // index in `messages` of the oldest message in the DOM
+
+// Section headers in either prompt style ("### ✅ What's Good" or "✅ **What's Good:**")
+const SECTION_CLASSES = { '✅': 'fb-good', '⚠️': 'fb-improve', '📝': 'fb-model', '💡': 'fb-model', '❓': 'fb-followup' };
+const SECTION_RE = /^(?:#{1,6}\s*)?(?:\*\*)?\s*(✅|⚠️|📝|💡|❓)/;
+
+function escapeHtml(text) {
+    return text.replace(/&/g, '&amp;').replace(/</g, '&lt;').replace(/>/g, '&gt;').replace(/"/g, '&quot;');
+}
+function renderInline(text) {
+    return escapeHtml(text)
+        .replace(/`([^`]+)`/g, '<code>$1</code>')
+        .replace(/\*\*([^*]+)\*\*/g, '<strong>$1</strong>')
+        .replace(/(^|[^*])\*([^*\s][^*]*)\*/g, '$1<em>$2</em>');
+}
+
+// Append-only Markdown renderer: complete lines become DOM nodes once,
+// only the unfinished last line is rewritten as tokens arrive.
+class MarkdownStream {
+    constructor(container) {
+        this.container = container;
+        this.block = container;
+        this.buffer = '';
+        this.list = null;
+        this.paragraph = null;
+        this.code = null;
+        this.pending = document.createElement('div');
+        this.pending.className = 'md-pending';
+        container.appendChild(this.pending);
+    }
+    push(text) {
+        this.buffer += text;
+        let newline;
+        while ((newline = this.buffer.indexOf('\n')) >= 0) {
+            this.renderLine(this.buffer.slice(0, newline));
+            this.buffer = this.buffer.slice(newline + 1);
         }
-        textarea:focus {
-            outline: none;
-            border-color: #667eea;
+        this.pending.textContent = this.buffer;
+    }
+    end() {
+        if (this.buffer) this.renderLine(this.buffer);
+        this.buffer = '';
+        this.pending.remove();
+    }
+    append(node) {
+        if (this.block === this.container) this.container.insertBefore(node, this.pending);
+        else this.block.appendChild(node);
+        return node;
+    }
+    renderLine(line) {
+        const trimmed = line.trim();
+        if (trimmed.startsWith('```')) {
+            if (this.code) {
+                this.code = null;
+            } else {
+                const pre = this.append(document.createElement('pre'));
+                this.code = pre.appendChild(document.createElement('code'));
+            }
+            this.list = this.paragraph = null;
+            return;
         }
-        .buttons {
-            display: flex;
-            gap: 10px;
-            margin-top: 10px;
+        if (this.code) {
+            this.code.appendChild(document.createTextNode(line + '\n'));
+            return;
         }
-        button {
-            padding: 12px 24px;
-            font-size: 1em;
-            border: none;
-            border-radius: 8px;
-            cursor: pointer;
-            font-weight: 600;
-            transition: all 0.3s;
+        if (!trimmed) {
+            this.list = this.paragraph = null;
+            return;
         }
-        .btn-primary {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            flex: 1;
+        const section = trimmed.match(SECTION_RE);
+        if (section) {
+            const block = document.createElement('section');
+            block.className = `fb-section ${SECTION_CLASSES[section[1]]}`;
+            const heading = block.appendChild(document.createElement('h4'));
+            heading.textContent = trimmed.replace(/^#+\s*/, '').replace(/\*\*/g, '').replace(/:\s*$/, '');
+            this.block = this.container;
+            this.append(block);
+            this.block = block;
+            this.list = this.paragraph = null;
+            return;
         }
-        .btn-primary:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 5px 15px rgba(102, 126, 234, 0.4);
+        const heading = trimmed.match(/^#{1,6}\s+(.*)$/);
+        if (heading) {
+            this.append(document.createElement('h5')).innerHTML = renderInline(heading[1]);
+            this.list = this.paragraph = null;
+            return;
         }
-        .btn-secondary {
-            background: #6c757d;
-            color: white;
+        const item = trimmed.match(/^(?:[-*•]|(\d+)\.)\s+(.*)$/);
+        if (item) {
+            const tag = item[1] ? 'OL' : 'UL';
+            if (!this.list || this.list.tagName !== tag) this.list = this.append(document.createElement(tag));
+            this.list.appendChild(document.createElement('li')).innerHTML = renderInline(item[2]);
+            this.paragraph = null;
+            return;
         }
-        .btn-secondary:hover {
-            background: #5a6268;
+        if (this.paragraph) {
+            this.paragraph.appendChild(document.createElement('br'));
+            this.paragraph.insertAdjacentHTML('beforeend', renderInline(trimmed));
+        } else {
+            this.paragraph = this.append(document.createElement('p'));
+            this.paragraph.innerHTML = renderInline(trimmed);
         }
-        button:disabled {
-            opacity: 0.6;
-            cursor: not-allowed;
+        this.list = null;
+    }
+}
+
+function createMessageNode(role) {
+    const messageDiv = document.createElement('div');
+    messageDiv.className = `message ${role}`;
+    const label = messageDiv.appendChild(document.createElement('strong'));
+    label.textContent = role === 'interviewer' ? 'Interviewer:' : 'You:';
+    const body = messageDiv.appendChild(document.createElement('div'));
+    body.className = 'message-body';
+    return { messageDiv, body };
+}
+function renderMessage(message) {
+    const { messageDiv, body } = createMessageNode(message.role);
+    if (message.role === 'interviewer') {
+        const stream = new MarkdownStream(body);
+        stream.push(message.content);
+        stream.end();
+    } else {
+        body.textContent = message.content;
+    }
+    return messageDiv;
+}
+function updateEarlierButton() {
+    const button = document.getElementById('showEarlier');
+    button.hidden = firstRendered === 0;
+    button.textContent = `Show ${Math.min(firstRendered, EARLIER_PAGE_SIZE)} earlier messages (${firstRendered} hidden)`;
+}
+function trimConversation() {
+    const conversation = document.getElementById('conversation');
+    while (messages.length - firstRendered > MAX_RENDERED_MESSAGES) {
+        conversation.querySelector('.message').remove();
+        firstRendered++;
+    }
+    updateEarlierButton();
+}
+function showEarlier() {
+    const conversation = document.getElementById('conversation');
+    const anchor = conversation.querySelector('.message');
+    const start = Math.max(firstRendered - EARLIER_PAGE_SIZE, 0);
+    const fragment = document.createDocumentFragment();
+    for (let i = start; i < firstRendered; i++) {
+        const node = renderMessage(messages[i]);
+        node.classList.add('restored');
+        fragment.appendChild(node);
+    }
+    conversation.insertBefore(fragment, anchor);
+    firstRendered = start;
+    updateEarlierButton();
+}
+function scrollToBottom() {
+    const conversation = document.getElementById('conversation');
+    conversation.scrollTop = conversation.scrollHeight;
+}
+function addMessage(role, content) {
+    const message = { role, content };
+    messages.push(message);
+    document.getElementById('conversation').appendChild(renderMessage(message));
+    trimConversation();
+    scrollToBottom();
+}
+// Open an interviewer message that is filled in as the reply streams
+function startStreamingMessage() {
+    const message = { role: 'interviewer', content: '' };
+    messages.push(message);
+    const { messageDiv, body } = createMessageNode('interviewer');
+    document.getElementById('conversation').appendChild(messageDiv);
+    trimConversation();
+    const stream = new MarkdownStream(body);
+    return {
+        push(delta) {
+            message.content += delta;
+            stream.push(delta);
+            scrollToBottom();
+        },
+        end() { stream.end(); }
+    };
+}
+
+document.getElementById('showEarlier').addEventListener('click', showEarlier);
+addMessage('interviewer', "Let's start! Tell me about yourself.");
+
+function showResumeReady(statusDiv, result) {
+    // The server keeps the condensed profile with the session; nothing to resend per turn
+    const saved = result.stats.tokens_saved_per_turn;
+    statusDiv.innerHTML = `<div class="success">✓ Resume processed! (${saved} fewer tokens per turn)</div>`;
+    setTimeout(() => statusDiv.innerHTML = '', 3000);
+}
+document.getElementById('resume').addEventListener('change', async function(e) {
+    const file = e.target.files[0];
+    if (!file) return;
+    const formData = new FormData();
+    formData.append('file', file);
+    formData.append('session_id', sessionId);
+    const statusDiv = document.getElementById('uploadStatus');
+    statusDiv.innerHTML = '<div class="loading">Uploading resume...</div>';
+    try {
+        const response = await fetch('/api/upload-resume', { method: 'POST', body: formData });
+        const data = await response.json();
+        if (!response.ok) {
+            statusDiv.innerHTML = `<div class="error">Error: ${escapeHtml(data.error)}</div>`;
+            return;
         }
-        .loading {
-            text-align: center;
-            padding: 20px;
-            color: #667eea;
+        if (data.status === 'done') {
+            showResumeReady(statusDiv, data.result);
+            return;
         }
-        .error {
-            background: #ffebee;
-            color: #c62828;
-            padding: 15px;
-            border-radius: 8px;
-            margin: 10px 0;
-            border-left: 4px solid #c62828;
+        // Processing continues in the background; the interview can start right away
+        statusDiv.innerHTML = '<div class="loading">Processing resume... you can start answering meanwhile.</div>';
+        const events = new EventSource(`/api/jobs/${data.job_id}/events`);
+        events.onmessage = function(event) {
+            const job = JSON.parse(event.data);
+            if (job.status === 'done') {
+                events.close();
+                showResumeReady(statusDiv, job.result);
+            } else if (job.status === 'failed') {
+                events.close();
+                statusDiv.innerHTML = `<div class="error">Error processing resume: ${escapeHtml(job.error)}</div>`;
+            }
+        };
+        events.onerror = function() {
+            events.close();
+            statusDiv.innerHTML = '<div class="error">Lost connection while processing resume.</div>';
+        };
+    } catch (error) {
+        statusDiv.innerHTML = `<div class="error">Error uploading resume: ${escapeHtml(error.message)}</div>`;
+    }
+});
+async function submitAnswer() {
+    const userInput = document.getElementById('userInput');
+    const message = userInput.value.trim();
+    const topic = document.getElementById('topic').value;
+    const statusDiv = document.getElementById('statusMessage');
+    const submitBtn = document.getElementById('submitBtn');
+    if (!message) {
+        statusDiv.innerHTML = '<div class="error">Please enter an answer!</div>';
+        return;
+    }
+    addMessage('user', message);
+    userInput.value = '';
+    submitBtn.disabled = true;
+    statusDiv.innerHTML = '<div class="loading">🤔 Thinking...</div>';
+    try {
+        const response = await fetch('/api/chat', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ session_id: sessionId, message: message, topic: topic, cohort: cohort, stream: true })
+        });
+        if (!response.ok) {
+            const data = await response.json();
+            statusDiv.innerHTML = `<div class="error">Error: ${escapeHtml(data.error)}</div>`;
+            return;
         }
-        .success {
-            background: #e8f5e9;
-            color: #2e7d32;
-            padding: 15px;
-            border-radius: 8px;
-            margin: 10px 0;
-            border-left: 4px solid #2e7d32;
+        // NDJSON: {"delta": ...} lines while the reply streams, then {"done": true, ...}
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        let reply = null;
+        let buffered = '';
+        while (true) {
+            const { value, done } = await reader.read();
+            if (done) break;
+            buffered += decoder.decode(value, { stream: true });
+            let newline;
+            while ((newline = buffered.indexOf('\n')) >= 0) {
+                const line = buffered.slice(0, newline);
+                buffered = buffered.slice(newline + 1);
+                if (!line) continue;
+                const event = JSON.parse(line);
+                if (event.error) throw new Error(event.error);
+                if (event.delta) {
+                    if (!reply) {
+                        reply = startStreamingMessage();
+                        statusDiv.innerHTML = '';
+                    }
+                    reply.push(event.delta);
+                }
+            }
         }
-    </style>
+        if (reply) reply.end();
+        statusDiv.innerHTML = '';
+    } catch (error) {
+        statusDiv.innerHTML = `<div class="error">Error: ${escapeHtml(error.message)}</div>`;
+    } finally {
+        submitBtn.disabled = false;
+    }
+}
+function downloadTranscript() {
+    // Let the browser stream the export straight to disk instead of buffering it in a Blob
+    const format = document.getElementById('transcriptFormat').value;
+    const a = document.createElement('a');
+    a.href = `/api/transcript?session_id=${encodeURIComponent(sessionId)}&format=${format}`;
+    a.download = `interview_transcript.${format}`;
+    a.click();
+}
+document.getElementById('userInput').addEventListener('keydown', function(e) {
+    if (e.key === 'Enter' && !e.shiftKey) {
+        e.preventDefault();
+        submitAnswer();
+    }
+});
+"""
+
+HTML_TEMPLATE = r"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>AI Interview Coach</title>
+    <link rel="stylesheet" href="__STYLES_HREF__">
 </head>
 <body>
     <div class="container">
@@ -182,116 +536,23 @@ HTML_TEMPLATE = """<!DOCTYPE html>
             <div id="uploadStatus"></div>
         </div>
         <div class="conversation" id="conversation">
-            <div class="message interviewer">
-                <strong>Interviewer:</strong>
-                <div>Let's start! Tell me about yourself.</div>
-            </div>
+            <button class="show-earlier" id="showEarlier" hidden></button>
         </div>
         <div class="input-section">
             <textarea id="userInput" placeholder="Type your answer here..."></textarea>
             <div class="buttons">
                 <button class="btn-primary" id="submitBtn" onclick="submitAnswer()">Submit Answer</button>
+                <select id="transcriptFormat" class="transcript-format">
+                    <option value="txt">Text</option>
+                    <option value="md">Markdown</option>
+                    <option value="jsonl">JSONL</option>
+                </select>
                 <button class="btn-secondary" onclick="downloadTranscript()">Download Transcript</button>
             </div>
             <div id="statusMessage"></div>
         </div>
     </div>
-    <script>
-        let sessionId = 'session_' + Date.now();
-        let resumeText = '';
-        document.getElementById('resume').addEventListener('change', async function(e) {
-            const file = e.target.files[0];
-            if (!file) return;
-            const formData = new FormData();
-            formData.append('file', file);
-            const statusDiv = document.getElementById('uploadStatus');
-            statusDiv.innerHTML = '<div class="loading">Uploading resume...</div>';
-            try {
-                const response = await fetch('/api/upload-resume', { method: 'POST', body: formData });
-                const data = await response.json();
-                if (response.ok) {
-                    resumeText = data.text;
-                    statusDiv.innerHTML = '<div class="success">✓ Resume uploaded successfully!</div>';
-                    setTimeout(() => statusDiv.innerHTML = '', 3000);
-                } else {
-                    statusDiv.innerHTML = `<div class="error">Error: ${data.error}</div>`;
-                }
-            } catch (error) {
-                statusDiv.innerHTML = `<div class="error">Error uploading resume: ${error.message}</div>`;
-            }
-        });
-        async function submitAnswer() {
-            const userInput = document.getElementById('userInput');
-            const message = userInput.value.trim();
-            const topic = document.getElementById('topic').value;
-            const statusDiv = document.getElementById('statusMessage');
-            const submitBtn = document.getElementById('submitBtn');
-            if (!message) {
-                statusDiv.innerHTML = '<div class="error">Please enter an answer!</div>';
-                return;
-            }
-            addMessage('user', message);
-            userInput.value = '';
-            submitBtn.disabled = true;
-            statusDiv.innerHTML = '<div class="loading">🤔 Thinking...</div>';
-            try {
-                const response = await fetch('/api/chat', {
-                    method: 'POST',
-                    headers: { 'Content-Type': 'application/json' },
-                    body: JSON.stringify({ session_id: sessionId, message: message, topic: topic, resume_text: resumeText })
-                });
-                const data = await response.json();
-                if (response.ok) {
-                    addMessage('interviewer', data.response);
-                    statusDiv.innerHTML = '';
-                } else {
-                    statusDiv.innerHTML = `<div class="error">Error: ${data.error}</div>`;
-                }
-            } catch (error) {
-                statusDiv.innerHTML = `<div class="error">Error: ${error.message}</div>`;
-            } finally {
-                submitBtn.disabled = false;
-            }
-        }
-        function addMessage(role, content) {
-            const conversation = document.getElementById('conversation');
-            const messageDiv = document.createElement('div');
-            messageDiv.className = `message ${role}`;
-            const label = role === 'interviewer' ? 'Interviewer' : 'You';
-            messageDiv.innerHTML = `<strong>${label}:</strong><div>${content}</div>`;
-            conversation.appendChild(messageDiv);
-            conversation.scrollTop = conversation.scrollHeight;
-        }
-        async function downloadTranscript() {
-            try {
-                const response = await fetch('/api/download-transcript', {
-                    method: 'POST',
-                    headers: { 'Content-Type': 'application/json' },
-                    body: JSON.stringify({ session_id: sessionId })
-                });
-                const data = await response.json();
-                if (response.ok) {
-                    const blob = new Blob([data.transcript], { type: 'text/plain' });
-                    const url = window.URL.createObjectURL(blob);
-                    const a = document.createElement('a');
-                    a.href = url;
-                    a.download = 'interview_transcript.txt';
-                    a.click();
-                    window.URL.revokeObjectURL(url);
-                } else {
-                    alert('Error: ' + data.error);
-                }
-            } catch (error) {
-                alert('Error downloading transcript: ' + error.message);
-            }
-        }
-        document.getElementById('userInput').addEventListener('keydown', function(e) {
-            if (e.key === 'Enter' && !e.shiftKey) {
-                e.preventDefault();
-                submitAnswer();
-            }
-        });
-    </script>
+    <script src="__SCRIPT_SRC__"></script>
 </body>
 </html>
 """
@@ -0,0 +1,91 @@
+import hashlib
+import json
+import os
+import secrets
+import threading
+import time
+from types import SimpleNamespace
+
+# Opt-in: set TRAFFIC_TRACE_PATH to append one compact JSON line per request.
+# Nothing identifying is written: session ids are salted hashes and payloads
+# are reduced to sizes. Keys are kept short because traces get large:
+#   t  epoch seconds            m  method          p  route rule
+#   s  status                   d  duration ms     rq request bytes
+#   rs response bytes (absent when streamed)       sid hashed session id
+#   n  user turns so far        st streamed        a  answer chars
+#   c  answer looks like code   tp topic           f  upload {"x": ext, "b": bytes, "w": inline}
+#   j  hashed job id            x  asset extension fmt transcript format
+#   u  upstream {"ms": latency, "pt": prompt tokens, "ct": completion tokens, "model"}
+TRACE_PATH = os.environ.get("TRAFFIC_TRACE_PATH")
+
+# A fixed salt makes hashed ids comparable across restarts; default is per process
+TRACE_SALT = os.environ.get("TRAFFIC_TRACE_SALT") or secrets.token_hex(16)
+
+# Local performance testing only: answer LLM calls with a stand-in that
+# reproduces the upstream latency and token counts sent by benchmarks/replay.py
+REPLAY_UPSTREAM = os.environ.get("REPLAY_UPSTREAM") == "1"
+
+CODE_HINTS = ("```", "{", "};", "def ", "#include", "public static", "=>")
+
+def looks_like_code(text):
+    return sum(hint in text for hint in CODE_HINTS) >= 2
+
+class TrafficRecorder:
+    """Append-only writer for anonymized request traces"""
+
+    def __init__(self, path):
+        self.file = open(path, "a", encoding="utf-8")
+        self.lock = threading.Lock()
+
+    def anonymize(self, session_id):
+        if not session_id:
+            return None
+        return hashlib.sha256((TRACE_SALT + str(session_id)).encode("utf-8")).hexdigest()[:12]
+
+    def write(self, event):
+        line = json.dumps({k: v for k, v in event.items() if v is not None}, separators=(",", ":"))
+        with self.lock:
+            self.file.write(line + "\n")
+            self.file.flush()
+
+recorder = TrafficRecorder(TRACE_PATH) if TRACE_PATH else None
+
+class ReplayUpstreamClient:
+    """Stand-in for the Groq client that sleeps and returns filler text per a recorded profile.
+
+    profile is the X-Replay-Upstream header: {"ms": latency, "pt": prompt tokens,
+    "ct": completion tokens}. Missing values fall back to a typical evaluation.
+    """
+
+    def __init__(self, profile):
+        profile = json.loads(profile) if profile else {}
+        self.latency = profile.get("ms", 1500) / 1000
+        self.prompt_tokens = profile.get("pt", 600)
+        self.completion_tokens = profile.get("ct", 400)
+        self.chat = SimpleNamespace(completions=self)
+
+    def content(self):
+        filler = "lorem ipsum dolor sit amet " * (self.completion_tokens * 4 // 27 + 1)
+        body = filler[:max(self.completion_tokens * 4 - 120, 0)]
+        return (
+            "### ✅ What's Good\n- Clear answer\n\n### ⚠️ Areas for Improvement\n- More depth\n\n"
+            f"### 📝 Model Answer\n{body}\n\n### ❓ Follow-up Question\nWhy?\n"
+        )
+
+    def create(self, stream=False, **kwargs):
+        usage = SimpleNamespace(prompt_tokens=self.prompt_tokens, completion_tokens=self.completion_tokens)
+        content = self.content()
+        if not stream:
+            time.sleep(self.latency)
+            message = SimpleNamespace(content=content)
+            return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=usage)
+        return self.stream(content, usage)
+
+    def stream(self, content, usage):
+        # Time to first token is a third of the latency, the rest is spread over the chunks
+        time.sleep(self.latency / 3)
+        pieces = [content[i:i + 16] for i in range(0, len(content), 16)]
+        for piece in pieces:
+            time.sleep(self.latency * 2 / 3 / len(pieces))
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=piece))], x_groq=None)
+        yield SimpleNamespace(choices=[], x_groq=SimpleNamespace(usage=usage))
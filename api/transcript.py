@@ -0,0 +1,41 @@
+import json
+
+# Export formats: format name -> (content type, file extension)
+TRANSCRIPT_FORMATS = {
+    "txt": ("text/plain; charset=utf-8", "txt"),
+    "md": ("text/markdown; charset=utf-8", "md"),
+    "jsonl": ("application/x-ndjson; charset=utf-8", "jsonl"),
+}
+
+def speaker(role):
+    return "Interviewer" if role == "assistant" else "You"
+
+def iter_txt(messages):
+    """Yield one 'Speaker: content' line per message (same layout as the old export)"""
+    for i, m in enumerate(messages):
+        prefix = "\n" if i else ""
+        yield f"{prefix}{speaker(m['role'])}: {m['content']}"
+
+def iter_markdown(messages, title="Interview Transcript"):
+    """Yield a Markdown document with one section per question/answer turn"""
+    yield f"# {title}\n"
+    turn = 0
+    for m in messages:
+        if m["role"] == "user":
+            turn += 1
+            yield f"\n## Turn {turn}\n\n### 👤 You\n\n{m['content']}\n"
+        else:
+            yield f"\n### 🤖 Interviewer\n\n{m['content']}\n"
+
+def iter_jsonl(messages, first_seq=1):
+    """Yield one JSON object per message, tagged with its sequence number"""
+    for seq, m in enumerate(messages, first_seq):
+        yield json.dumps({"seq": seq, "role": m["role"], "content": m["content"]}, ensure_ascii=False) + "\n"
+
+def iter_transcript(messages, fmt="txt"):
+    """Yield the transcript of messages (system prompt already removed) in chunks"""
+    if fmt == "md":
+        return iter_markdown(messages)
+    if fmt == "jsonl":
+        return iter_jsonl(messages)
+    return iter_txt(messages)
@@ -0,0 +1,93 @@
+import os
+import threading
+from datetime import date
+
+# Quotas (0 disables a limit); override with environment variables. The session
+# quota is off by default: every turn resends the history, so cumulative tokens
+# grow quadratically and any fixed cap ends long interviews early.
+MAX_SESSION_TOKENS = int(os.environ.get("MAX_SESSION_TOKENS", "0"))
+MAX_DAILY_TOKENS = int(os.environ.get("MAX_DAILY_TOKENS", "200000"))  # per client
+MAX_ANSWER_CHARS = int(os.environ.get("MAX_ANSWER_CHARS", "8000"))
+
+def estimate_tokens(text):
+    """Rough token count (~4 characters per token) used before the real usage is known"""
+    return (len(text) + 3) // 4
+
+def estimate_prompt_tokens(messages):
+    return sum(estimate_tokens(m["content"]) for m in messages)
+
+def completion_usage(obj):
+    """(prompt_tokens, completion_tokens) from a completion or the last streamed chunk.
+
+    Groq reports usage on `usage` for regular completions and on `x_groq.usage`
+    for the final chunk of a stream. Returns None when neither is present.
+    """
+    usage = getattr(obj, "usage", None) or getattr(getattr(obj, "x_groq", None), "usage", None)
+    if usage is None:
+        return None
+    return usage.prompt_tokens or 0, usage.completion_tokens or 0
+
+def estimate_usage(messages, reply):
+    """(prompt_tokens, completion_tokens) estimated from the text, for streams that report no usage"""
+    return estimate_prompt_tokens(messages), estimate_tokens(reply)
+
+def new_counters():
+    return {"requests": 0, "prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0, "wall_time_ms": 0}
+
+class UsageTracker:
+    """Token and wall-time accounting per session and per client, with quota checks"""
+
+    def __init__(self):
+        self.sessions = {}  # session id -> counters
+        self.clients = {}  # client id -> counters for today (plus "day")
+        self.lock = threading.Lock()
+
+    def _client(self, client_id):
+        today = date.today().isoformat()
+        counters = self.clients.get(client_id)
+        if counters is None or counters["day"] != today:
+            counters = self.clients[client_id] = dict(new_counters(), day=today)
+        return counters
+
+    def check(self, session_id, client_id, answer, prompt_tokens):
+        """Return (error message, HTTP status) if the next call would break a quota, else None.
+
+        prompt_tokens is an estimate for the upcoming request; pass client_id=None
+        to skip the per-client daily quota.
+        """
+        if MAX_ANSWER_CHARS and len(answer) > MAX_ANSWER_CHARS:
+            return f"Answer is too long ({len(answer)} characters, limit {MAX_ANSWER_CHARS}).", 413
+        with self.lock:
+            used = self.sessions.get(session_id, {}).get("total_tokens", 0)
+            if MAX_SESSION_TOKENS and used + prompt_tokens > MAX_SESSION_TOKENS:
+                return "This session has used its token quota. Please start a new interview.", 429
+            if client_id is not None and MAX_DAILY_TOKENS:
+                if self._client(client_id)["total_tokens"] + prompt_tokens > MAX_DAILY_TOKENS:
+                    return "Daily token quota reached. Please try again tomorrow.", 429
+        return None
+
+    def record(self, session_id, client_id, usage, wall_time):
+        """Add one upstream call; usage is (prompt_tokens, completion_tokens) or None"""
+        prompt_tokens, completion_tokens = usage or (0, 0)
+        with self.lock:
+            buckets = [self.sessions.setdefault(session_id, new_counters())]
+            if client_id is not None:
+                buckets.append(self._client(client_id))
+            for counters in buckets:
+                counters["requests"] += 1
+                counters["prompt_tokens"] += prompt_tokens
+                counters["completion_tokens"] += completion_tokens
+                counters["total_tokens"] += prompt_tokens + completion_tokens
+                counters["wall_time_ms"] += round(wall_time * 1000)
+
+    def summary(self, session_id=None, client_id=None):
+        with self.lock:
+            return {
+                "session": dict(self.sessions.get(session_id) or new_counters()),
+                "client": dict(self._client(client_id)) if client_id is not None else None,
+                "quotas": {
+                    "max_session_tokens": MAX_SESSION_TOKENS,
+                    "max_daily_tokens": MAX_DAILY_TOKENS,
+                    "max_answer_chars": MAX_ANSWER_CHARS,
+                },
+            }
@@ -0,0 +1,167 @@
+"""Grade a file of written answers with the interviewer's four-section feedback.
+
+Reads (topic, question, answer, optional resume) records from JSONL or CSV,
+evaluates them with a bounded worker pool and appends one JSON line per
+record to the output file. The output doubles as the checkpoint: rerunning
+the same command skips records that already have a successful result.
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from dotenv import load_dotenv
+from groq import Groq
+
+from api.feedback import build_context, build_system_prompt, has_required_sections, parse_and_enforce_format
+from api.resume import preprocess_resume
+
+DEFAULT_MODEL = "openai/gpt-oss-120b"
+
+def read_records(path):
+    """Yield input records as dicts, each with a stable 'id'"""
+    with open(path, newline="", encoding="utf-8") as f:
+        if path.endswith(".csv"):
+            rows = csv.DictReader(f)
+        else:
+            rows = (json.loads(line) for line in f if line.strip())
+        for line_no, row in enumerate(rows, 1):
+            row.setdefault("id", str(line_no))
+            row["id"] = str(row["id"])
+            yield row
+
+def completed_ids(path):
+    """Ids that already have a successful result in the output file"""
+    done = set()
+    if not os.path.exists(path):
+        return done
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                result = json.loads(line)
+            except ValueError:
+                continue  # partial line from an interrupted run
+            if "error" not in result:
+                done.add(result["id"])
+    return done
+
+def evaluate(client, record, model, retries):
+    """Evaluate a single answer; returns the result line as a dict"""
+    # JSONL fields may be numbers or null; treat every field as text
+    topic = str(record.get("topic") or "General")
+    question = str(record.get("question") or "")
+    answer = str(record.get("answer") or "")
+    result = {"id": record["id"], "topic": topic, "question": question}
+    if not question.strip() or not answer.strip():
+        result["error"] = "question and answer are required"
+        return result
+
+    resume = preprocess_resume(str(record["resume"]))["profile_text"] if record.get("resume") else ""
+    messages = [
+        {"role": "system", "content": build_system_prompt(build_context(resume, topic), True)},
+        {"role": "assistant", "content": question},
+        {"role": "user", "content": answer},
+    ]
+
+    for attempt in range(retries + 1):
+        start = time.perf_counter()
+        try:
+            completion = client.chat.completions.create(
+                model=model,
+                messages=messages,
+                temperature=0.3,
+                max_completion_tokens=2048
+            )
+        except Exception as e:
+            if attempt == retries:
+                result["error"] = str(e)
+                return result
+            time.sleep(2 ** attempt)
+            continue
+
+        feedback = parse_and_enforce_format(completion.choices[0].message.content or "")
+        result.update({
+            "feedback": feedback,
+            "formatted": has_required_sections(feedback),
+            "latency_ms": round((time.perf_counter() - start) * 1000),
+            "model": model,
+        })
+        return result
+
+def run(args):
+    load_dotenv()
+    api_key = os.getenv("GROQ_API_KEY")
+    if not api_key:
+        sys.exit("GROQ_API_KEY is not set")
+    client = Groq(api_key=api_key)
+
+    done = completed_ids(args.output)
+    if done:
+        print(f"Resuming: {len(done)} records already evaluated", file=sys.stderr)
+
+    pending = (r for r in read_records(args.input) if r["id"] not in done)
+    stats = {"ok": 0, "errors": 0}
+    started = last_report = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=args.workers) as pool, open(args.output, "a", encoding="utf-8") as out:
+        in_flight = {}  # future -> record id
+        exhausted = False
+        while in_flight or not exhausted:
+            # Keep at most 2x workers queued so huge inputs are never loaded at once
+            while not exhausted and len(in_flight) < args.workers * 2:
+                record = next(pending, None)
+                if record is None:
+                    exhausted = True
+                    break
+                in_flight[pool.submit(evaluate, client, record, args.model, args.retries)] = record["id"]
+            if not in_flight:
+                break
+
+            finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in finished:
+                record_id = in_flight.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    # One malformed record must not stop the run or lose the other results
+                    result = {"id": record_id, "error": f"{type(e).__name__}: {e}"}
+                stats["errors" if "error" in result else "ok"] += 1
+                out.write(json.dumps(result, ensure_ascii=False) + "\n")
+            out.flush()  # every flushed line is a checkpoint
+
+            now = time.perf_counter()
+            if now - last_report >= args.report_every:
+                last_report = now
+                report(stats, now - started)
+
+    report(stats, time.perf_counter() - started)
+    return 1 if stats["errors"] else 0
+
+def report(stats, elapsed):
+    total = stats["ok"] + stats["errors"]
+    rate = total / elapsed if elapsed else 0.0
+    print(f"{total} evaluated ({stats['errors']} errors) in {elapsed:.1f}s - {rate:.2f} answers/s", file=sys.stderr)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("input", help="JSONL or CSV file with topic, question, answer and optional resume/id columns")
+    parser.add_argument("output", help="JSONL file results are appended to (also used to resume)")
+    parser.add_argument("--workers", type=int, default=4, help="concurrent requests (default: 4)")
+    parser.add_argument("--model", default=DEFAULT_MODEL, help=f"model to grade with (default: {DEFAULT_MODEL})")
+    parser.add_argument("--retries", type=int, default=2, help="retries per record on API errors (default: 2)")
+    parser.add_argument("--report-every", type=float, default=10.0, help="seconds between progress lines (default: 10)")
+    args = parser.parse_args()
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.retries < 0:
+        parser.error("--retries cannot be negative")
+    sys.exit(run(args))
+
+if __name__ == '__main__':
+    main()
+
+
+# python batch_evaluate.py answers.jsonl results.jsonl --workers 8
@@ -0,0 +1,125 @@
+"""Measure serverless cold-start cost of the Flask API, per route.
+
+Every measurement runs in a fresh interpreter, like a new serverless
+instance: import api.index, then serve a single request with Flask's test
+client. Routes that would call the LLM are hit with inputs that stop just
+before the upstream request, so the numbers cover import and setup only.
+Exits non-zero when a budget is exceeded.
+"""
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# route name -> (method, path, request kwargs, cold-start budget in ms)
+ROUTES = {
+    "index": ("GET", "/", {}, 400),
+    "get-history": ("POST", "/api/get-history", {"json": {"session_id": "bench"}}, 400),
+    # Empty message: creates the Groq client, then returns 400 before calling upstream
+    "chat": ("POST", "/api/chat", {"json": {"session_id": "bench", "message": ""}}, 1200),
+    # Not a real document, processed inline: imports the DOCX parser, then fails to parse
+    "upload-resume": ("POST", "/api/upload-resume", {"docx": True}, 1500),
+    "warmup": ("GET", "/api/warmup", {}, 2500),
+}
+
+# Budget for `import api.index` alone, and modules that must not load at import
+IMPORT_BUDGET_MS = 300
+LAZY_MODULES = ("groq", "PyPDF2", "docx")
+
+PROBE = r"""
+import io, json, sys, time
+started = time.perf_counter()
+import api.index
+imported = time.perf_counter()
+method, path, kwargs = json.loads(sys.argv[1])
+if kwargs.pop("docx", False):
+    kwargs["data"] = {"file": (io.BytesIO(b"not a docx"), "resume.docx"), "wait": "1"}
+    kwargs["content_type"] = "multipart/form-data"
+response = api.index.app.test_client().open(path, method=method, **kwargs)
+done = time.perf_counter()
+print(json.dumps({
+    "import_ms": (imported - started) * 1000,
+    "request_ms": (done - imported) * 1000,
+    "status": response.status_code,
+}))
+"""
+
+def probe(method, path, kwargs):
+    env = dict(os.environ, GROQ_API_KEY=os.environ.get("GROQ_API_KEY", "bench-key"))
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE, json.dumps([method, path, kwargs])],
+        cwd=ROOT, env=env, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+def import_profile():
+    """Modules loaded by `import api.index`: {name: cumulative ms} for every module, and the top-level names"""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import api.index"],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    ).stderr
+    modules, top_level = {}, []
+    for line in stderr.splitlines():
+        match = re.match(r"import time:\s+\d+ \|\s+(\d+) \| (\s*)(\S+)", line)
+        if match:
+            modules[match.group(3)] = int(match.group(1)) / 1000
+            if not match.group(2):
+                top_level.append(match.group(3))
+    return modules, top_level
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters per route (default: 5)")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args()
+
+    failures = []
+    modules, top_level = import_profile()
+    for name in LAZY_MODULES:
+        if name in modules:
+            failures.append(f"{name} is imported by api.index ({modules[name]:.0f} ms)")
+
+    slowest = sorted(((name, modules[name]) for name in top_level), key=lambda m: -m[1])[:10]
+    report = {"import_profile_ms": dict(slowest), "routes": {}}
+    for name, (method, path, kwargs, budget) in ROUTES.items():
+        samples = [probe(method, path, dict(kwargs)) for _ in range(args.runs)]
+        import_ms = statistics.median(s["import_ms"] for s in samples)
+        request_ms = statistics.median(s["request_ms"] for s in samples)
+        total_ms = import_ms + request_ms
+        report["routes"][name] = {
+            "status": samples[-1]["status"],
+            "import_ms": round(import_ms, 1),
+            "first_request_ms": round(request_ms, 1),
+            "cold_start_ms": round(total_ms, 1),
+            "budget_ms": budget,
+        }
+        if import_ms > IMPORT_BUDGET_MS:
+            failures.append(f"{name}: import took {import_ms:.0f} ms (budget {IMPORT_BUDGET_MS} ms)")
+        if total_ms > budget:
+            failures.append(f"{name}: cold start took {total_ms:.0f} ms (budget {budget} ms)")
+
+    if args.json:
+        print(json.dumps(dict(report, failures=failures), indent=2))
+    else:
+        print("Slowest top-level imports for api.index:")
+        for module, ms in report["import_profile_ms"].items():
+            print(f"  {module:<30} {ms:8.1f} ms")
+        print(f"\n{'route':<15} {'status':>6} {'import':>10} {'request':>10} {'total':>10} {'budget':>10}")
+        for name, r in report["routes"].items():
+            print(f"{name:<15} {r['status']:>6} {r['import_ms']:>8.1f}ms {r['first_request_ms']:>8.1f}ms "
+                  f"{r['cold_start_ms']:>8.1f}ms {r['budget_ms']:>8}ms")
+        for failure in failures:
+            print(f"OVER BUDGET: {failure}")
+
+    sys.exit(1 if failures else 0)
+
+if __name__ == '__main__':
+    main()
+
+
+# python benchmarks/cold_start.py --runs 5
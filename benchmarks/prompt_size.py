@@ -0,0 +1,179 @@
+"""Compare interviewer prompt variants on size, latency and format compliance.
+
+Each variant in api.feedback.PROMPT_VARIANTS is run against the same fixed
+set of simulated answers (benchmarks/data/prompt_samples.jsonl). Three ways to
+get model output:
+
+  local     deterministic stand-in that returns each sample's reference output;
+            reports prompt sizes only (no compliance, no recommendation)
+  live      call Groq (needs GROQ_API_KEY); --record saves outputs for replay
+  recorded  replay outputs saved by an earlier `live --record` run
+
+Compliance is the share of replies that have all four headers: raw against
+the headers the variant's own prompt asks for, parsed against the canonical
+headers after parse_and_enforce_format().
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api.feedback import (
+    PROMPT_VARIANTS, SECTION_HEADERS, build_context, build_system_prompt, has_required_sections, parse_and_enforce_format
+)
+from api.usage import completion_usage, estimate_prompt_tokens, estimate_tokens
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+SAMPLES_PATH = os.path.join(DATA_DIR, "prompt_samples.jsonl")
+RECORDED_PATH = os.path.join(DATA_DIR, "prompt_recordings.jsonl")
+
+# A variant is "as compliant" as the best one if it is within this margin
+COMPLIANCE_TOLERANCE = 0.02
+
+# Headers each variant's prompt asks for (the api prompt uses bold headers, not ###)
+VARIANT_HEADERS = {
+    "api": ("✅ **What's Good:**", "⚠️ **Areas for Improvement:**", "💡 **Model Answer:**", "❓ **Follow-up Question:**"),
+}
+
+def raw_compliant(variant, output):
+    return all(header in output for header in VARIANT_HEADERS.get(variant, SECTION_HEADERS))
+
+def load_jsonl(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+def build_messages(variant, sample):
+    context = build_context(sample.get("resume", ""), sample.get("topic", "General"))
+    return [
+        {"role": "system", "content": build_system_prompt(context, True, variant)},
+        {"role": "assistant", "content": sample["question"]},
+        {"role": "user", "content": sample["answer"]},
+    ]
+
+def run_local(variant, sample, messages):
+    output = sample["reference_output"]
+    return output, estimate_prompt_tokens(messages), estimate_tokens(output), 0.0
+
+def make_live_runner(model):
+    from dotenv import load_dotenv
+    from groq import Groq
+    load_dotenv()
+    client = Groq(api_key=os.environ["GROQ_API_KEY"])
+
+    def run_live(variant, sample, messages):
+        started = time.perf_counter()
+        completion = client.chat.completions.create(
+            model=model, messages=messages, temperature=0.3, max_completion_tokens=2048
+        )
+        latency_ms = (time.perf_counter() - started) * 1000
+        output = completion.choices[0].message.content or ""
+        prompt_tokens, completion_tokens = completion_usage(completion) or (
+            estimate_prompt_tokens(messages), estimate_tokens(output)
+        )
+        return output, prompt_tokens, completion_tokens, latency_ms
+    return run_live
+
+def make_recorded_runner(path):
+    recordings = {(r["variant"], r["sample_id"]): r for r in load_jsonl(path)}
+
+    def run_recorded(variant, sample, messages):
+        r = recordings[(variant, sample["id"])]
+        return r["output"], r["prompt_tokens"], r["completion_tokens"], r["latency_ms"]
+    return run_recorded
+
+def benchmark(variants, samples, runner, record_to=None):
+    results = {}
+    for variant in variants:
+        rows = []
+        for sample in samples:
+            messages = build_messages(variant, sample)
+            output, prompt_tokens, completion_tokens, latency_ms = runner(variant, sample, messages)
+            rows.append({
+                "system_tokens": estimate_tokens(messages[0]["content"]),
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "latency_ms": latency_ms,
+                "raw_compliant": raw_compliant(variant, output),
+                "parsed_compliant": has_required_sections(parse_and_enforce_format(output)),
+            })
+            if record_to:
+                record_to.write(json.dumps({
+                    "variant": variant, "sample_id": sample["id"], "output": output,
+                    "prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens,
+                    "latency_ms": latency_ms,
+                }, ensure_ascii=False) + "\n")
+        results[variant] = {
+            "system_tokens": statistics.mean(r["system_tokens"] for r in rows),
+            "prompt_tokens": statistics.mean(r["prompt_tokens"] for r in rows),
+            "completion_tokens": statistics.mean(r["completion_tokens"] for r in rows),
+            "latency_ms_p50": statistics.median(r["latency_ms"] for r in rows),
+            "raw_compliance": sum(r["raw_compliant"] for r in rows) / len(rows),
+            "parsed_compliance": sum(r["parsed_compliant"] for r in rows) / len(rows),
+        }
+    return results
+
+def recommend(results):
+    """Smallest prompt among the variants whose parsed compliance is close to the best"""
+    best = max(r["parsed_compliance"] for r in results.values())
+    eligible = [v for v, r in results.items() if r["parsed_compliance"] >= best - COMPLIANCE_TOLERANCE]
+    return min(eligible, key=lambda v: results[v]["prompt_tokens"])
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mode", choices=["local", "live", "recorded"], default="local")
+    parser.add_argument("--variants", nargs="+", default=list(PROMPT_VARIANTS), choices=list(PROMPT_VARIANTS))
+    parser.add_argument("--samples", default=SAMPLES_PATH, help="JSONL of simulated answers")
+    parser.add_argument("--recordings", default=RECORDED_PATH, help="JSONL of recorded outputs")
+    parser.add_argument("--record", action="store_true", help="save live outputs to --recordings")
+    parser.add_argument("--model", default="openai/gpt-oss-120b", help="model for --mode live")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    samples = load_jsonl(args.samples)
+    if args.mode == "live":
+        runner = make_live_runner(args.model)
+    elif args.mode == "recorded":
+        runner = make_recorded_runner(args.recordings)
+    else:
+        runner = run_local
+
+    record_to = open(args.recordings, "w", encoding="utf-8") if args.mode == "live" and args.record else None
+    try:
+        results = benchmark(args.variants, samples, runner, record_to)
+    finally:
+        if record_to:
+            record_to.close()
+    # Local outputs ignore the prompt, so only sizes mean anything there
+    local = args.mode == "local"
+    if local:
+        for r in results.values():
+            for key in ("completion_tokens", "latency_ms_p50", "raw_compliance", "parsed_compliance"):
+                r.pop(key)
+    choice = None if local else recommend(results)
+
+    if args.json:
+        print(json.dumps({"mode": args.mode, "results": results, "recommended": choice}, indent=2))
+        return
+
+    print(f"{len(samples)} samples, mode={args.mode}\n")
+    if local:
+        print(f"{'variant':<10} {'system':>8} {'prompt':>8}")
+        for variant, r in results.items():
+            print(f"{variant:<10} {r['system_tokens']:>8.0f} {r['prompt_tokens']:>8.0f}")
+        print("\nLocal mode measures prompt size only; use --mode live (or recorded) to pick a variant.")
+        return
+    print(f"{'variant':<10} {'system':>8} {'prompt':>8} {'compl.':>8} {'p50 ms':>9} {'raw fmt':>8} {'parsed':>8}")
+    for variant, r in results.items():
+        print(f"{variant:<10} {r['system_tokens']:>8.0f} {r['prompt_tokens']:>8.0f} {r['completion_tokens']:>8.0f} "
+              f"{r['latency_ms_p50']:>9.0f} {r['raw_compliance']:>8.0%} {r['parsed_compliance']:>8.0%}")
+    print(f"\nRecommended: {choice} (set INTERVIEWER_PROMPT_VARIANT={choice})")
+
+if __name__ == '__main__':
+    main()
+
+
+# python benchmarks/prompt_size.py --mode live --record && python benchmarks/prompt_size.py --mode recorded
@@ -0,0 +1,387 @@
+"""Replay a recorded traffic trace against a local instance and compare builds.
+
+Record on a live instance with TRAFFIC_TRACE_PATH=trace.jsonl (see
+api/traffic.py). Replay against a local build started with
+REPLAY_UPSTREAM=1, so LLM calls take the recorded upstream latency and token
+counts instead of reaching Groq:
+
+    REPLAY_UPSTREAM=1 flask --app api.index run --port 5000 &
+    python benchmarks/replay.py trace.jsonl --pid $! --save before.json
+    # check out the other build, restart the server, then
+    python benchmarks/replay.py trace.jsonl --pid $! --compare before.json
+
+Sessions replay concurrently, each in its recorded order and pacing (scaled by
+--speed). Answers and resumes are synthetic text of the recorded sizes.
+"""
+import argparse
+import io
+import json
+import os
+import sys
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+import uuid
+import zipfile
+from collections import defaultdict
+
+WORDS = "latency throughput cache index query thread lock queue memory process socket request".split()
+CODE = "def solve(items):\n    seen = {}\n    for i, x in enumerate(items):\n        seen[x] = i\n    return seen\n"
+
+def filler(chars, code=False):
+    unit = CODE if code else " ".join(WORDS) + " "
+    text = ("```python\n" if code else "") + unit * (chars // len(unit) + 1)
+    return text[:chars]
+
+def make_docx(size):
+    """Minimal DOCX of roughly size bytes (stored, not deflated, so the size holds)"""
+    paragraphs = "".join(
+        f"<w:p><w:r><w:t>{filler(80)}</w:t></w:r></w:p>" for _ in range(max(size - 900, 100) // 110 + 1)
+    )
+    parts = {
+        "[Content_Types].xml": (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            '<Override PartName="/word/document.xml" ContentType='
+            '"application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/></Types>'
+        ),
+        "_rels/.rels": (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            '<Relationship Id="rId1" Target="word/document.xml" Type='
+            '"http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"/></Relationships>'
+        ),
+        "word/document.xml": (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+            f'<w:body>{paragraphs}</w:body></w:document>'
+        ),
+    }
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_STORED) as archive:
+        for name, content in parts.items():
+            archive.writestr(name, content)
+    return buffer.getvalue()
+
+def make_pdf(size):
+    """Single-page PDF of roughly size bytes with extractable text lines"""
+    lines = "".join(f"({filler(80)}) Tj T* " for _ in range(max(size - 600, 100) // 90 + 1))
+    stream = f"BT /F1 10 Tf 12 TL 40 800 Td {lines}ET"
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        "<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] "
+        "/Resources << /Font << /F1 5 0 R >> >> /Contents 4 0 R >>",
+        f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream",
+        "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    pdf = "%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(pdf))
+        pdf += f"{number} 0 obj\n{body}\nendobj\n"
+    xref = len(pdf)
+    pdf += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n"
+    pdf += "".join(f"{offset:010d} 00000 n \n" for offset in offsets)
+    pdf += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n"
+    return pdf.encode("latin-1")
+
+def multipart(fields, filename, content):
+    boundary = uuid.uuid4().hex
+    body = b""
+    for name, value in fields.items():
+        body += f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'.encode()
+    body += (
+        f'--{boundary}\r\nContent-Disposition: form-data; name="file"; filename="{filename}"\r\n'
+        f"Content-Type: application/octet-stream\r\n\r\n"
+    ).encode() + content + f"\r\n--{boundary}--\r\n".encode()
+    return body, f"multipart/form-data; boundary={boundary}"
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * pct / 100), len(ordered) - 1)]
+
+def load_trace(path):
+    """Trace events grouped into ordered per-session lists, sorted by first event.
+
+    Job polling carries no session id, so it joins the session that uploaded
+    the job; requests with neither (page loads, assets) replay on their own.
+    """
+    with open(path, encoding="utf-8") as f:
+        events = [json.loads(line) for line in f if line.strip()]
+    events = sorted((e for e in events if e.get("p")), key=lambda e: e["t"])
+    job_owner = {e["j"]: e["sid"] for e in events if e.get("j") and e.get("sid")}
+    sessions = defaultdict(list)
+    for number, event in enumerate(events):
+        key = event.get("sid") or job_owner.get(event.get("j")) or f"solo-{number}"
+        sessions[key].append(event)
+    return sorted(sessions.values(), key=lambda s: s[0]["t"])
+
+class ResourceSampler(threading.Thread):
+    """Samples CPU time and RSS of server processes from /proc (Linux only)"""
+
+    def __init__(self, pids, interval=0.25):
+        super().__init__(daemon=True)
+        self.pids = pids
+        self.interval = interval
+        self.stopped = threading.Event()
+        self.rss_samples = []
+        self.cpu_start = self.cpu_seconds()
+
+    def cpu_seconds(self):
+        total = 0
+        for pid in self.pids:
+            with open(f"/proc/{pid}/stat") as f:
+                fields = f.read().rsplit(")", 1)[1].split()
+            total += int(fields[11]) + int(fields[12])  # utime, stime
+        return total / os.sysconf("SC_CLK_TCK")
+
+    def rss_mb(self):
+        total = 0
+        for pid in self.pids:
+            with open(f"/proc/{pid}/status") as f:
+                total += next(int(line.split()[1]) for line in f if line.startswith("VmRSS:"))
+        return total / 1024
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            self.rss_samples.append(self.rss_mb())
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
+        samples = self.rss_samples or [self.rss_mb()]
+        return {
+            "cpu_s": round(self.cpu_seconds() - self.cpu_start, 2),
+            "peak_rss_mb": round(max(samples), 1),
+            "mean_rss_mb": round(sum(samples) / len(samples), 1),
+        }
+
+class Replayer:
+    def __init__(self, base_url, speed, timeout):
+        self.base_url = base_url.rstrip("/")
+        self.speed = speed
+        self.timeout = timeout
+        self.run_id = uuid.uuid4().hex[:8]
+        self.lock = threading.Lock()
+        self.results = []  # (route, recorded status, status, ttfb ms, total ms, lag ms)
+        self.jobs = {}  # recorded job hash -> job id issued by this server
+        self.asset_paths = None
+
+    def request(self, method, path, body=None, headers=None):
+        req = urllib.request.Request(self.base_url + path, data=body, method=method, headers=headers or {})
+        started = time.perf_counter()
+        try:
+            with urllib.request.urlopen(req, timeout=self.timeout) as response:
+                first = time.perf_counter()
+                payload = response.read()
+                status = response.status
+        except urllib.error.HTTPError as e:
+            first = time.perf_counter()
+            payload = e.read()
+            status = e.code
+        except OSError:
+            first = time.perf_counter()
+            payload, status = b"", None
+        done = time.perf_counter()
+        return status, payload, (first - started) * 1000, (done - started) * 1000
+
+    def asset_path(self, extension):
+        """Hashed asset URLs differ between builds, so take them from this build's page shell"""
+        if self.asset_paths is None:
+            _, page, _, _ = self.request("GET", "/")
+            found = {}
+            for token in page.decode("utf-8", "replace").split('"'):
+                if token.startswith("/assets/"):
+                    found[token.rsplit(".", 1)[-1]] = token
+            self.asset_paths = found
+        return self.asset_paths.get(extension)
+
+    def build(self, event, session_id):
+        """(method, path, body, headers) re-creating the recorded request, or None to skip it"""
+        rule, method = event["p"], event["m"]
+        headers = {"X-Forwarded-For": f"10.{hash(session_id) % 250}.0.1"}
+        upstream = {k: v for k, v in event.get("u", {}).items() if k in ("ms", "pt", "ct") and v is not None}
+        if upstream:
+            headers["X-Replay-Upstream"] = json.dumps(upstream)
+
+        if rule == "/assets/<name>":
+            path = self.asset_path(event.get("x"))
+            return (method, path, None, headers) if path else None
+        if rule.startswith("/api/jobs/"):
+            job_id = self.jobs.get(event.get("j"))
+            return (method, rule.replace("<job_id>", job_id), None, headers) if job_id else None
+        if rule == "/api/upload-resume":
+            upload = event.get("f", {})
+            extension = upload.get("x", "docx")
+            make = make_pdf if extension == "pdf" else make_docx
+            fields = {"session_id": session_id}
+            if upload.get("w"):
+                fields["wait"] = "1"
+            body, content_type = multipart(fields, f"resume.{extension}", make(upload.get("b", 20000)))
+            return method, rule, body, dict(headers, **{"Content-Type": content_type})
+        if rule == "/api/search":
+            headers["X-Instructor-Token"] = os.environ.get("INSTRUCTOR_TOKEN", "")
+            return method, "/api/search?" + urllib.parse.urlencode({"q": " ".join(WORDS[:2])}), None, headers
+
+        params = {"session_id": session_id}
+        if rule == "/api/chat":
+            params.update(
+                message=filler(event.get("a", 0), event.get("c", False)),
+                topic=event.get("tp", "General"),
+                cohort="replay",
+                stream=event.get("st", False)
+            )
+        if "fmt" in event:
+            params["format"] = event["fmt"]
+        if rule == "/" or rule.startswith("/api/warmup") or rule in ("/api/model-stats", "/api/analytics"):
+            return method, rule, None, headers
+        if method == "GET":
+            return method, rule + "?" + urllib.parse.urlencode(params), None, headers
+        return method, rule, json.dumps(params).encode(), dict(headers, **{"Content-Type": "application/json"})
+
+    def play(self, events, start, t0):
+        session_id = f"replay-{self.run_id}-{uuid.uuid4().hex[:8]}"
+        for event in events:
+            due = start + (event["t"] - t0) / self.speed if self.speed else time.perf_counter()
+            time.sleep(max(due - time.perf_counter(), 0))
+            lag = (time.perf_counter() - due) * 1000
+            built = self.build(event, session_id)
+            if built is None:
+                continue
+            method, path, body, headers = built
+            status, payload, ttfb, total = self.request(method, path, body, headers)
+            if event["p"] == "/api/upload-resume" and status == 202 and event.get("j"):
+                self.jobs[event["j"]] = json.loads(payload)["job_id"]
+            with self.lock:
+                self.results.append((f"{method} {event['p']}", event.get("s"), status, ttfb, total, lag))
+
+    def run(self, sessions):
+        """Start each session's thread when its first request is due and wait for all of them"""
+        t0 = sessions[0][0]["t"]
+        start = time.perf_counter()
+        threads = []
+        for events in sessions:
+            due = start + (events[0]["t"] - t0) / self.speed if self.speed else start
+            time.sleep(max(due - time.perf_counter(), 0))
+            thread = threading.Thread(target=self.play, args=(events, start, t0), daemon=True)
+            thread.start()
+            threads.append(thread)
+        for thread in threads:
+            thread.join()
+        return time.perf_counter() - start
+
+def summarize(results, recorded):
+    routes = {}
+    for route in sorted({r[0] for r in results}):
+        rows = [r for r in results if r[0] == route]
+        totals = [r[4] for r in rows]
+        routes[route] = {
+            "count": len(rows),
+            "errors": sum(1 for r in rows if r[2] is None or r[2] >= 500),
+            "status_mismatches": sum(1 for r in rows if r[1] is not None and r[2] != r[1]),
+            "p50_ms": round(percentile(totals, 50), 1),
+            "p95_ms": round(percentile(totals, 95), 1),
+            "ttfb_p50_ms": round(percentile([r[3] for r in rows], 50), 1),
+            "recorded_p50_ms": round(percentile(recorded[route], 50), 1) if recorded.get(route) else None,
+        }
+    return routes
+
+def compare(baseline, report, max_regression):
+    """Print per-route and resource deltas; return the routes whose p95 regressed past max_regression %"""
+    def delta(old, new):
+        return f"{(new - old) / old * 100:+6.1f}%" if old else "    n/a"
+
+    regressions = []
+    print(f"\n{'route':<34} {'p50 before':>11} {'p50 after':>10} {'':>7} {'p95 before':>11} {'p95 after':>10}")
+    for route, new in report["routes"].items():
+        old = baseline["routes"].get(route)
+        if old is None:
+            print(f"{route:<34} {'(new)':>11}")
+            continue
+        print(f"{route:<34} {old['p50_ms']:>9.1f}ms {new['p50_ms']:>8.1f}ms {delta(old['p50_ms'], new['p50_ms'])} "
+              f"{old['p95_ms']:>9.1f}ms {new['p95_ms']:>8.1f}ms {delta(old['p95_ms'], new['p95_ms'])}")
+        if max_regression is not None and old["p95_ms"] and \
+                (new["p95_ms"] - old["p95_ms"]) / old["p95_ms"] * 100 > max_regression:
+            regressions.append(route)
+    old_resources, new_resources = baseline.get("resources"), report.get("resources")
+    if old_resources and new_resources:
+        for key in ("cpu_s", "peak_rss_mb", "mean_rss_mb"):
+            print(f"{key:<34} {old_resources[key]:>11} {new_resources[key]:>10} "
+                  f"{delta(old_resources[key], new_resources[key])}")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("trace", help="JSONL trace recorded with TRAFFIC_TRACE_PATH")
+    parser.add_argument("--url", default="http://127.0.0.1:5000", help="instance to replay against")
+    parser.add_argument("--speed", type=float, default=1.0,
+                        help="time scale: 2 replays twice as fast, 0 sends each session back to back (default: 1)")
+    parser.add_argument("--timeout", type=float, default=120, help="per-request timeout in seconds")
+    parser.add_argument("--pid", type=int, action="append", default=[],
+                        help="server process to sample CPU and RSS from (repeat for worker processes)")
+    parser.add_argument("--save", help="write the report as JSON to this file")
+    parser.add_argument("--compare", help="baseline report saved with --save by another build")
+    parser.add_argument("--max-regression", type=float,
+                        help="with --compare, exit non-zero if any route's p95 grows by more than this percent")
+    args = parser.parse_args()
+
+    sessions = load_trace(args.trace)
+    if not sessions:
+        sys.exit(f"No replayable requests in {args.trace}")
+    recorded = defaultdict(list)
+    for events in sessions:
+        for event in events:
+            if "d" in event:
+                recorded[f"{event['m']} {event['p']}"].append(event["d"])
+
+    sampler = ResourceSampler(args.pid) if args.pid else None
+    if sampler:
+        sampler.start()
+    replayer = Replayer(args.url, args.speed, args.timeout)
+    elapsed = replayer.run(sessions)
+    lags = [r[5] for r in replayer.results]
+
+    report = {
+        "trace": os.path.basename(args.trace),
+        "speed": args.speed,
+        "sessions": len(sessions),
+        "requests": len(replayer.results),
+        "elapsed_s": round(elapsed, 1),
+        "max_lag_ms": round(max(lags), 1) if lags else 0,
+        "routes": summarize(replayer.results, recorded),
+        "resources": sampler.stop() if sampler else None,
+    }
+
+    print(f"Replayed {report['requests']} requests from {report['sessions']} sessions in {report['elapsed_s']}s "
+          f"(max start lag {report['max_lag_ms']} ms)")
+    print(f"\n{'route':<34} {'count':>6} {'errors':>6} {'p50':>10} {'p95':>10} {'ttfb p50':>10} {'recorded p50':>13}")
+    for route, r in report["routes"].items():
+        recorded_p50 = f"{r['recorded_p50_ms']:.1f}ms" if r["recorded_p50_ms"] is not None else "-"
+        print(f"{route:<34} {r['count']:>6} {r['errors']:>6} {r['p50_ms']:>8.1f}ms {r['p95_ms']:>8.1f}ms "
+              f"{r['ttfb_p50_ms']:>8.1f}ms {recorded_p50:>13}")
+    if report["resources"]:
+        print("\nServer: " + ", ".join(f"{k} {v}" for k, v in report["resources"].items()))
+
+    regressions = []
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            regressions = compare(json.load(f), report, args.max_regression)
+        for route in regressions:
+            print(f"REGRESSION: {route} p95 grew by more than {args.max_regression}%")
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    sys.exit(1 if regressions else 0)
+
+if __name__ == '__main__':
+    main()
+
+
+# REPLAY_UPSTREAM=1 flask --app api.index run --port 5000 &
+# python benchmarks/replay.py trace.jsonl --speed 2 --pid $! --save baseline.json
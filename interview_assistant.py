@@ -1,12 +1,22 @@
 import streamlit as st
+import logging
 import os
-import re
-from groq import Groq
+import time
+import uuid
 from dotenv import load_dotenv
-import PyPDF2
-import docx
+from api.analytics import record_turn
+from api.feedback import (
+    FORMAT_REPAIR_PROMPT, INTERVIEWER_PROMPT, build_context, build_system_prompt,
+    has_required_sections, parse_and_enforce_format, resolve_prompt_variant
+)
+from api.model_router import ModelRouter, default_routes
+from api.usage import UsageTracker, completion_usage, estimate_prompt_tokens, estimate_tokens, estimate_usage
+from api.resume import extract_resume_text, preprocess_resume
+from api.search_index import index_turn
+from api.transcript import TRANSCRIPT_FORMATS, iter_transcript
 
 # --- Setup ---
+logger = logging.getLogger(__name__)
 st.set_page_config(page_title="AI Interview Coach", layout="centered")
 st.title("Mock Interviewer")
 
@@ -14,40 +24,47 @@ st.title("Mock Interviewer")
 load_dotenv()
 
 groq_api_key = os.getenv("GROQ_API_KEY")
-groq_client = Groq(api_key=groq_api_key) if groq_api_key else None
+
+# System prompt wording (see PROMPT_VARIANTS in api/feedback.py)
+PROMPT_VARIANT = resolve_prompt_variant(os.getenv("INTERVIEWER_PROMPT_VARIANT", "full"), "full")
+
+# --- Groq client (created on first submit; groq is slow to import) ---
+@st.cache_resource
+def get_groq_client():
+    if not groq_api_key:
+        return None
+    from groq import Groq
+    return Groq(api_key=groq_api_key)
+
+# --- Model router (one per process so latency stats survive reruns) ---
+@st.cache_resource
+def get_router():
+    return ModelRouter(default_routes(
+        os.getenv("GROQ_LARGE_MODEL", "openai/gpt-oss-120b"),
+        os.getenv("GROQ_ALTERNATE_MODEL", "llama-3.3-70b-versatile")
+    ))
+
+router = get_router()
+
+# --- Token accounting (shared across sessions, keyed by a per-browser-session id) ---
+@st.cache_resource
+def get_usage_tracker():
+    return UsageTracker()
+
+usage_tracker = get_usage_tracker()
 
 # --- Initialize state ---
 if "messages" not in st.session_state:
     st.session_state.messages = [
-        {"role": "system", "content": "You are a technical interviewer preparing B.Tech CSE students for internships.\n\n"
-                                      "CRITICAL: You MUST respond using EXACTLY this structure. Copy this format exactly:\n\n"
-                                      "### ✅ What's Good\n"
-                                      "[2-3 bullet points about what the student did well]\n\n"
-                                      "### ⚠️ Areas for Improvement\n"
-                                      "[2-3 bullet points about what could be improved]\n\n"
-                                      "### 📝 Model Answer\n"
-                                      "[A complete, detailed, professional answer that a candidate would give in an interview. "
-                                      "This must be comprehensive with multiple paragraphs, examples, and detailed explanations. "
-                                      "This section should be SIGNIFICANTLY longer than the evaluation sections - at least 3-5 paragraphs.]\n\n"
-                                      "### ❓ Follow-up Question\n"
-                                      "[Ask the next interview question]\n\n"
-                                      "IMPORTANT RULES:\n"
-                                      "1. ALWAYS start with '### ✅ What's Good' (exactly this text)\n"
-                                      "2. ALWAYS include '### ⚠️ Areas for Improvement' (exactly this text)\n"
-                                      "3. ALWAYS include '### 📝 Model Answer' (exactly this text)\n"
-                                      "4. ALWAYS end with '### ❓ Follow-up Question' (exactly this text)\n"
-                                      "5. Use these exact headers with the emojis and markdown formatting\n"
-                                      "6. Do NOT write in paragraphs without headers\n"
-                                      "7. Do NOT use numbered lists like '1. What's good'\n"
-                                      "8. Do NOT combine sections\n"
-                                      "9. The Model Answer must be a complete answer, not a summary\n\n"
-                                      "Tailor questions for B.Tech CSE level."},
+        {"role": "system", "content": INTERVIEWER_PROMPT + "\nTailor questions for B.Tech CSE level."},
         {"role": "assistant", "content": "Let's start! Tell me about yourself."}
     ]
-if "resume_text" not in st.session_state:
-    st.session_state.resume_text = ""
+if "resume_profile" not in st.session_state:
+    st.session_state.resume_profile = ""
 if "input_area" not in st.session_state:
     st.session_state.input_area = ""
+if "session_id" not in st.session_state:
+    st.session_state.session_id = uuid.uuid4().hex
 
 # --- Topic selector ---
 topic = st.selectbox("Choose interview focus area:", ["General", "DSA", "DBMS", "OOP", "HR", "System Design"])
@@ -55,285 +72,19 @@ topic = st.selectbox("Choose interview focus area:", ["General", "DSA", "DBMS",
 # --- Resume upload ---
 uploaded_resume = st.file_uploader("Upload Resume (PDF or DOCX)", type=["pdf", "docx"])
 if uploaded_resume:
-    if uploaded_resume.type == "application/pdf":
-        pdf_reader = PyPDF2.PdfReader(uploaded_resume)
-        text = ""
-        for page in pdf_reader.pages:
-            text += page.extract_text() + "\n"
-        st.session_state.resume_text = text
-    elif uploaded_resume.type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
-        doc = docx.Document(uploaded_resume)
-        text = "\n".join([para.text for para in doc.paragraphs])
-        st.session_state.resume_text = text
-    st.success("Resume uploaded and parsed successfully!")
-
-# --- Helper function to parse and enforce response format ---
-def parse_and_enforce_format(content):
-    """Parse the response and enforce the required format structure."""
-    # Check if this is an initial greeting (no evaluation needed)
-    if "Tell me about yourself" in content or ("Let's start" in content and len(content) < 50):
-        return content
-    
-    # Check if format is already correct
-    has_correct_format = (
-        "### ✅ What's Good" in content or "### ✅ What's good" in content
-    ) and (
-        "### ⚠️ Areas for Improvement" in content or "### ⚠️ Areas for improvement" in content
-    ) and (
-        "### 📝 Model Answer" in content or "### 📝 Model answer" in content
-    ) and (
-        "### ❓ Follow-up Question" in content or "### ❓ Follow-up question" in content or "### ❓ Followup Question" in content
+    # Streamlit reruns the script on every interaction; only parse a newly uploaded file
+    resume_key = (uploaded_resume.name, uploaded_resume.size)
+    if st.session_state.get("resume_key") != resume_key:
+        # Condense once; the profile replaces the raw text in every later prompt
+        resume = preprocess_resume(extract_resume_text(uploaded_resume.name, uploaded_resume.getvalue()) or "")
+        st.session_state.resume_profile = resume["profile_text"]
+        st.session_state.resume_stats = resume["stats"]
+        st.session_state.resume_key = resume_key
+    stats = st.session_state.resume_stats
+    st.success(
+        f"Resume uploaded and parsed successfully! Condensed from ~{stats['raw_tokens']} "
+        f"to ~{stats['profile_tokens']} tokens per turn."
     )
-    
-    if has_correct_format:
-        # Format is already correct, just normalize headers
-        content = content.replace("### ✅ What's good", "### ✅ What's Good")
-        content = content.replace("### ⚠️ Areas for improvement", "### ⚠️ Areas for Improvement")
-        content = content.replace("### 📝 Model answer", "### 📝 Model Answer")
-        content = content.replace("### ❓ Follow-up question", "### ❓ Follow-up Question")
-        content = content.replace("### ❓ Followup Question", "### ❓ Follow-up Question")
-        return content
-    
-    # Try to extract sections using regex-like splitting
-    sections = {}
-    
-    # Patterns to find sections - including conversational formats
-    patterns = {
-        "whats_good": [
-            r"###\s*✅\s*What'?s?\s+Good",
-            r"✅\s*What'?s?\s+Good",
-            r"\*\*What'?s?\s+Good\*\*",
-            r"What'?s?\s+Good:",
-            r"\d+\.\s*What'?s?\s+good:?",
-            r"What'?s?\s+good:?",
-            r"1\.\s*What'?s?\s+good",
-        ],
-        "areas_improvement": [
-            r"###\s*⚠️\s*Areas\s+for\s+Improvement",
-            r"⚠️\s*Areas\s+for\s+Improvement",
-            r"\*\*Areas\s+for\s+Improvement\*\*",
-            r"Areas\s+for\s+Improvement:",
-            r"\d+\.\s*What\s+can\s+be\s+improved:?",
-            r"What\s+can\s+be\s+improved:?",
-            r"2\.\s*What\s+can\s+be\s+improved",
-            r"Areas?\s+for\s+improvement:?",
-            r"Improvement:?",
-        ],
-        "model_answer": [
-            r"###\s*📝\s*Model\s+Answer",
-            r"📝\s*Model\s+Answer",
-            r"\*\*Model\s+Answer\*\*",
-            r"Model\s+Answer:",
-            r"\d+\.\s*(A\s+)?model\s+answer:?",
-            r"(A\s+)?model\s+answer:?",
-            r"3\.\s*(A\s+)?model\s+answer",
-            r"A\s+good\s+(answer|introduction|response)",
-        ],
-        "followup": [
-            r"###\s*❓\s*Follow-?up\s+Question",
-            r"❓\s*Follow-?up\s+Question",
-            r"\*\*Follow-?up\s+Question\*\*",
-            r"Follow-?up\s+Question:",
-            r"Now,?\s+let'?s",
-            r"Can\s+you\s+explain",
-            r"Now\s+let'?s\s+dive",
-            r"Let'?s\s+dive",
-        ]
-    }
-    
-    # Find all section markers in content
-    section_positions = []
-    for section_name, pattern_list in patterns.items():
-        for pattern in pattern_list:
-            matches = list(re.finditer(pattern, content, re.IGNORECASE | re.MULTILINE))
-            for match in matches:
-                section_positions.append((match.start(), section_name, match.group()))
-    
-    # Sort by position
-    section_positions.sort(key=lambda x: x[0])
-    
-    # Extract content between sections
-    if section_positions:
-        for i, (pos, section_name, marker) in enumerate(section_positions):
-            # Find end position (start of next section or end of content)
-            if i + 1 < len(section_positions):
-                end_pos = section_positions[i + 1][0]
-            else:
-                end_pos = len(content)
-            
-            # Extract section content (skip the marker line)
-            section_content = content[pos:end_pos]
-            # Remove the marker line
-            lines = section_content.split('\n')
-            if len(lines) > 1:
-                section_text = '\n'.join(lines[1:]).strip()
-            else:
-                section_text = ""
-            
-            if section_text:
-                sections[section_name] = section_text
-    
-    # If we found sections, reconstruct in proper format
-    if sections:
-        formatted_parts = []
-        if "whats_good" in sections:
-            formatted_parts.append("### ✅ What's Good\n" + sections["whats_good"])
-        if "areas_improvement" in sections:
-            formatted_parts.append("### ⚠️ Areas for Improvement\n" + sections["areas_improvement"])
-        if "model_answer" in sections:
-            formatted_parts.append("### 📝 Model Answer\n" + sections["model_answer"])
-        if "followup" in sections:
-            formatted_parts.append("### ❓ Follow-up Question\n" + sections["followup"])
-        
-        if formatted_parts:
-            return "\n\n".join(formatted_parts) + "\n"
-    
-    # Try to extract from conversational/numbered format (like "1. What's good:", "2. What can be improved:", etc.)
-    content_lower = content.lower()
-    
-    # Check for numbered list format
-    if re.search(r'\d+\.\s*(what\'?s?\s+good|what\'?s?\s+can\s+be\s+improved|model\s+answer)', content_lower):
-        # Split by numbered items
-        lines = content.split('\n')
-        current_section = None
-        section_content = {"whats_good": [], "areas_improvement": [], "model_answer": [], "followup": []}
-        
-        i = 0
-        while i < len(lines):
-            line = lines[i]
-            line_lower = line.lower().strip()
-            
-            # Check if line starts a new section
-            if re.match(r'^\d+\.\s*(what\'?s?\s+good|what\s+is\s+good)', line_lower):
-                current_section = "whats_good"
-                # Extract content after the marker (could be on same line or next lines)
-                match = re.search(r':\s*(.+)', line, re.IGNORECASE)
-                if match:
-                    content_after_colon = match.group(1).strip()
-                    if content_after_colon:
-                        section_content["whats_good"].append(content_after_colon)
-            elif re.match(r'^\d+\.\s*(what\s+can\s+be\s+improved|areas?\s+for\s+improvement|improvement)', line_lower):
-                current_section = "areas_improvement"
-                match = re.search(r':\s*(.+)', line, re.IGNORECASE)
-                if match:
-                    content_after_colon = match.group(1).strip()
-                    if content_after_colon:
-                        section_content["areas_improvement"].append(content_after_colon)
-            elif re.match(r'^\d+\.\s*(a\s+)?model\s+answer', line_lower):
-                current_section = "model_answer"
-                match = re.search(r':\s*(.+)', line, re.IGNORECASE)
-                if match:
-                    content_after_colon = match.group(1).strip()
-                    if content_after_colon:
-                        section_content["model_answer"].append(content_after_colon)
-            elif current_section and line.strip():
-                # Continue adding to current section until we hit another numbered item or question
-                if re.match(r'^\d+\.', line.strip()):
-                    # Hit another numbered item, stop current section
-                    current_section = None
-                    continue
-                section_content[current_section].append(line.strip())
-            i += 1
-        
-        # Extract follow-up question (usually starts with "Now" or "Can you" or contains a question mark)
-        question_lines = []
-        question_start_idx = None
-        
-        # Look for question starting phrases
-        for line_idx, line in enumerate(lines):
-            line_stripped = line.strip()
-            if re.match(r'^(Now,?\s+let\'?s|Can\s+you\s+explain|Let\'?s\s+dive)', line_stripped, re.IGNORECASE):
-                question_start_idx = line_idx
-                break
-        
-        # If no clear question start found, look for sentences with question marks near the end
-        if question_start_idx is None:
-            for line_idx in range(len(lines) - 1, max(0, len(lines) - 5), -1):
-                if '?' in lines[line_idx]:
-                    question_start_idx = line_idx
-                    break
-        
-        # Extract question content
-        if question_start_idx is not None:
-            for line_idx in range(question_start_idx, len(lines)):
-                line = lines[line_idx].strip()
-                if line:
-                    question_lines.append(line)
-        
-        # Reconstruct in proper format
-        formatted_parts = []
-        
-        if section_content["whats_good"]:
-            whats_good_text = '\n'.join(section_content["whats_good"]).strip()
-            # Convert to bullet points if it's not already
-            if not whats_good_text.startswith('-'):
-                whats_good_text = '- ' + whats_good_text.replace('\n', '\n- ')
-            formatted_parts.append("### ✅ What's Good\n" + whats_good_text)
-        
-        if section_content["areas_improvement"]:
-            areas_text = '\n'.join(section_content["areas_improvement"]).strip()
-            if not areas_text.startswith('-'):
-                areas_text = '- ' + areas_text.replace('\n', '\n- ')
-            formatted_parts.append("### ⚠️ Areas for Improvement\n" + areas_text)
-        
-        if section_content["model_answer"]:
-            model_text = '\n'.join(section_content["model_answer"]).strip()
-            formatted_parts.append("### 📝 Model Answer\n" + model_text)
-        elif len(content) > 300:
-            # If we have long content but no model answer extracted, use middle section
-            paragraphs = [p.strip() for p in content.split('\n\n') if p.strip() and len(p.strip()) > 50]
-            if paragraphs:
-                # Use the longest paragraph as model answer
-                model_text = max(paragraphs, key=len)
-                formatted_parts.append("### 📝 Model Answer\n" + model_text)
-        
-        if question_lines:
-            formatted_parts.append("### ❓ Follow-up Question\n" + ' '.join(question_lines))
-        elif len(formatted_parts) < 4:
-            # Try to find question at the end
-            last_paragraphs = [p.strip() for p in content.split('\n\n') if p.strip()]
-            if last_paragraphs and re.search(r'\?', last_paragraphs[-1]):
-                formatted_parts.append("### ❓ Follow-up Question\n" + last_paragraphs[-1])
-        
-        if len(formatted_parts) >= 3:  # At least 3 sections found
-            return "\n\n".join(formatted_parts) + "\n"
-    
-    # If we still couldn't parse, try splitting by sentences/paragraphs
-    if len(content) > 200:
-        # Look for question marks to identify the follow-up question
-        sentences = re.split(r'([.!?]+)', content)
-        question_text = ""
-        non_question_text = []
-        
-        for i in range(len(sentences)):
-            if sentences[i].strip() and '?' in sentences[i]:
-                # Found a question
-                question_idx = i
-                question_text = ''.join(sentences[question_idx:question_idx+2] if question_idx+1 < len(sentences) else [sentences[question_idx]])
-                non_question_text = ''.join(sentences[:question_idx])
-                break
-        
-        if question_text and len(non_question_text) > 100:
-            # Split non-question text into evaluation and model answer
-            paragraphs = [p.strip() for p in non_question_text.split('\n\n') if p.strip()]
-            if len(paragraphs) >= 2:
-                # First paragraph(s) = evaluation, rest = model answer
-                eval_text = paragraphs[0] if paragraphs else ""
-                model_text = '\n\n'.join(paragraphs[1:]) if len(paragraphs) > 1 else '\n\n'.join(paragraphs)
-                
-                return (
-                    "### ✅ What's Good\n"
-                    "- Good effort in answering the question\n\n"
-                    "### ⚠️ Areas for Improvement\n"
-                    "- Could provide more detail and examples\n\n"
-                    "### 📝 Model Answer\n"
-                    + model_text + "\n\n"
-                    "### ❓ Follow-up Question\n"
-                    + question_text.strip()
-                )
-    
-    # Last resort: return original content
-    return content
 
 # --- Helper function to format interviewer response ---
 def format_interviewer_response(content):
@@ -407,6 +158,30 @@ for msg in st.session_state.messages[1:]:  # skip system prompt
                 unsafe_allow_html=True
             )
 
+# --- Format repair ---
+def repair_format(groq_client, reply):
+    """Ask the fast model to rewrite a reply into the four sections; keep the original on failure"""
+    messages = [
+        {"role": "system", "content": FORMAT_REPAIR_PROMPT},
+        {"role": "user", "content": reply}
+    ]
+    started = time.perf_counter()
+    try:
+        completion, _ = router.create(
+            groq_client,
+            "repair",
+            messages=messages,
+            temperature=0,
+            max_completion_tokens=2048
+        )
+    except Exception:
+        return reply
+    content = completion.choices[0].message.content or ""
+    usage = completion_usage(completion) or estimate_usage(messages, content)
+    usage_tracker.record(st.session_state.session_id, None, usage, time.perf_counter() - started)
+    repaired = parse_and_enforce_format(content)
+    return repaired if has_required_sections(repaired) else reply
+
 # --- Clear input helper ---
 def clear_input():
     st.session_state.input_area = ""
@@ -417,71 +192,41 @@ user_input = st.text_area("Your Answer", key="input_area")
 # --- Submit button ---
 def handle_submit():
     user_input = st.session_state.input_area
+    groq_client = get_groq_client()
     if groq_client and user_input.strip():
+        # Enforce quotas before spending anything upstream
+        quota_error = usage_tracker.check(
+            st.session_state.session_id,
+            None,
+            user_input,
+            estimate_prompt_tokens(st.session_state.messages) + estimate_tokens(user_input + st.session_state.resume_profile)
+        )
+        if quota_error:
+            st.warning(quota_error[0])
+            return
+
         # Add user response
         st.session_state.messages.append({"role": "user", "content": user_input})
 
         with st.spinner("Thinking..."):
             # Add resume + topic context into system prompt dynamically
-            context = ""
-            if st.session_state.resume_text:
-                context += f"\nHere is the candidate's resume:\n{st.session_state.resume_text}\n"
-            if topic != "General":
-                context += f"\nFocus questions on: {topic}\n"
-
-            # Create an extremely explicit system prompt with the exact format template
-            format_reminder_text = ""
+            context = build_context(st.session_state.resume_profile, topic)
+
             # Add stronger format reminder for evaluation responses (not initial greeting)
-            if len(st.session_state.messages) > 2:  # More than system + initial greeting
-                format_reminder_text = (
-                    "\n\n⚠️⚠️⚠️ CRITICAL FORMAT REMINDER ⚠️⚠️⚠️\n"
-                    "You MUST respond using EXACTLY these headers (copy them exactly):\n"
-                    "### ✅ What's Good\n"
-                    "### ⚠️ Areas for Improvement\n"
-                    "### 📝 Model Answer\n"
-                    "### ❓ Follow-up Question\n\n"
-                    "Do NOT use:\n"
-                    "- Numbered lists like '1. What's good:'\n"
-                    "- Paragraphs without headers\n"
-                    "- Combined sections\n"
-                    "- Any other format\n\n"
-                    "You MUST use the exact headers shown above with the emojis and markdown formatting.\n"
-                )
-            
-            system_prompt = (
-                "You are a technical interviewer preparing B.Tech CSE students for internships.\n\n"
-                "CRITICAL: You MUST respond using EXACTLY this structure. Copy this format exactly:\n\n"
-                "### ✅ What's Good\n"
-                "[2-3 bullet points about what the student did well]\n\n"
-                "### ⚠️ Areas for Improvement\n"
-                "[2-3 bullet points about what could be improved]\n\n"
-                "### 📝 Model Answer\n"
-                "[A complete, detailed, professional answer that a candidate would give in an interview. "
-                "This must be comprehensive with multiple paragraphs, examples, and detailed explanations. "
-                "This section should be SIGNIFICANTLY longer than the evaluation sections - at least 3-5 paragraphs.]\n\n"
-                "### ❓ Follow-up Question\n"
-                "[Ask the next interview question]\n\n"
-                "IMPORTANT RULES:\n"
-                "1. ALWAYS start with '### ✅ What's Good' (exactly this text)\n"
-                "2. ALWAYS include '### ⚠️ Areas for Improvement' (exactly this text)\n"
-                "3. ALWAYS include '### 📝 Model Answer' (exactly this text)\n"
-                "4. ALWAYS end with '### ❓ Follow-up Question' (exactly this text)\n"
-                "5. Use these exact headers with the emojis and markdown formatting\n"
-                "6. Do NOT write in paragraphs without headers\n"
-                "7. Do NOT use numbered lists like '1. What's good'\n"
-                "8. Do NOT combine sections\n"
-                "9. The Model Answer must be a complete answer, not a summary\n"
-                + format_reminder_text
-                + context
-            )
+            format_reminder = len(st.session_state.messages) > 2  # More than system + initial greeting
+            system_prompt = build_system_prompt(context, format_reminder, PROMPT_VARIANT)
             
             st.session_state.messages[0]["content"] = system_prompt
             
             # Use the messages directly (system prompt already has format reminder)
             api_messages = st.session_state.messages
 
-            completion = groq_client.chat.completions.create(
-                model="openai/gpt-oss-120b",
+            # Answer to the opening question is cheap; everything after is a full evaluation
+            task = "opening" if len(api_messages) <= 3 else "evaluate"
+            started = time.perf_counter()
+            completion, _ = router.create(
+                groq_client,
+                task,
                 messages=api_messages,  # Use messages with format reminder
                 temperature=0.3,  # Lower temperature for more deterministic, format-following responses
                 max_completion_tokens=2048,  # Increased for longer, more detailed model answers
@@ -489,11 +234,16 @@ def handle_submit():
             )
 
             reply = ""
+            usage = None
             placeholder = st.empty()
             for chunk in completion:
-                if chunk.choices[0].delta.content:
+                usage = completion_usage(chunk) or usage  # reported on the last chunk
+                if chunk.choices and chunk.choices[0].delta.content:
                     reply += chunk.choices[0].delta.content
                     placeholder.markdown(f"**Interviewer (typing):** {reply}")
+            usage = usage or estimate_usage(api_messages, reply)
+            latency = time.perf_counter() - started
+            usage_tracker.record(st.session_state.session_id, None, usage, latency)
 
             # clear the typing preview once final message is ready
             placeholder.empty()
@@ -501,10 +251,27 @@ def handle_submit():
             # Post-process reply to enforce format structure
             # The parse_and_enforce_format function handles both structured and unstructured responses
             formatted_reply = parse_and_enforce_format(reply)
+            if not has_required_sections(formatted_reply):
+                formatted_reply = repair_format(groq_client, formatted_reply)
             
             # Save final reply into conversation (use formatted version)
             st.session_state.messages.append({"role": "assistant", "content": formatted_reply})
 
+            # Index the turn for search and analytics; never fail the turn over it
+            messages = st.session_state.messages
+            turn = sum(1 for m in messages if m["role"] == "user")
+            try:
+                index_turn(st.session_state.session_id, turn, topic, len(messages) - 2, user_input, formatted_reply)
+            except Exception as e:
+                logger.warning("Search indexing failed: %s", e)
+            try:
+                record_turn(
+                    st.session_state.session_id, turn, topic, "streamlit", user_input, formatted_reply,
+                    latency, usage
+                )
+            except Exception as e:
+                logger.warning("Analytics update failed: %s", e)
+
         # clear input after processing
         clear_input()
     else:
@@ -512,13 +279,22 @@ def handle_submit():
 
 st.button("Submit Answer", on_click=handle_submit)
 
+session_usage = usage_tracker.summary(st.session_state.session_id)["session"]
+st.caption(
+    f"Tokens used this session: {session_usage['total_tokens']} "
+    f"({session_usage['prompt_tokens']} prompt / {session_usage['completion_tokens']} completion)"
+)
+
 # --- Download transcript ---
-if st.button("Download Transcript (TXT)"):
-    transcript = "\n".join([
-        f"{'Interviewer' if m['role']=='assistant' else 'You'}: {m['content']}"
-        for m in st.session_state.messages[1:]  # skip system prompt
-    ])
-    st.download_button("Download Now", transcript, "interview_transcript.txt")
+transcript_format = st.selectbox("Transcript format:", list(TRANSCRIPT_FORMATS), format_func=str.upper)
+if st.button("Download Transcript"):
+    content_type, extension = TRANSCRIPT_FORMATS[transcript_format]
+    # Encode chunk by chunk so only the encoded export is held, not an extra joined copy
+    transcript = b"".join(
+        chunk.encode("utf-8")
+        for chunk in iter_transcript(st.session_state.messages[1:], transcript_format)  # skip system prompt
+    )
+    st.download_button("Download Now", transcript, f"interview_transcript.{extension}", mime=content_type)
 
 
 # streamlit run interview_assistant.py